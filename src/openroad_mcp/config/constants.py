@@ -32,5 +32,8 @@ CHUNK_JOIN_THRESHOLD = 100  # Number of chunks before using bytearray optimizati
 LARGE_IO_THRESHOLD = 10000  # 10KB - threshold for logging large I/O operations
 SLOW_OPERATION_THRESHOLD = 1.0  # 1 second - threshold for logging slow operations
 
+# Filesystem validation caching
+VALIDATION_CACHE_TTL_SECONDS = 30.0  # How long cached directory/path lookups are trusted
+
 # JS safe integer max (for memory overflow protection)
 JS_SAFE_INTEGER_MAX = 2**53
@@ -97,7 +97,7 @@ class OpenROADManager:
             await session.send_command(command)
             result = await session.read_output(actual_timeout)
 
-            self.logger.debug(f"Executed command in session {session_id}: {command.strip()}")
+            self.logger.debug("Executed command in session %s: %s", session_id, command.strip())
             return result
 
         except Exception:
@@ -338,7 +338,7 @@ class OpenROADManager:
                     await session.cleanup()
                     del self._sessions[session_id]
                     cleaned_count += 1
-                    self.logger.debug(f"Cleaned up terminated session {session_id}")
+                    self.logger.debug("Cleaned up terminated session %s", session_id)
             except Exception as e:
                 self.logger.error(f"Error during session {session_id} cleanup: {e}")
                 if force_cleanup and session_id in self._sessions:
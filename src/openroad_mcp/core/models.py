@@ -198,3 +198,10 @@ class ReadImageResult(BaseResult):
     image_data: str | None = None
     metadata: ImageMetadata | None = None
     message: str | None = None
+
+
+class ReadImagesResult(BaseResult):
+    """Result from reading several report images in one call."""
+
+    images: list[ReadImageResult] = Field(default_factory=list)
+    message: str | None = None
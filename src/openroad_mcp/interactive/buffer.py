@@ -31,7 +31,7 @@ class CircularBuffer:
         self._data_available = asyncio.Event()
 
         if max_size == 0 or max_size > LARGE_BUFFER_THRESHOLD:
-            logger.debug(f"Created CircularBuffer with max_size={max_size} bytes")
+            logger.debug("Created CircularBuffer with max_size=%d bytes", max_size)
 
     async def append(self, data: bytes) -> None:
         """Add data to buffer, evicting oldest chunks if needed."""
@@ -55,7 +55,7 @@ class CircularBuffer:
                 evicted_bytes += old_size
 
             if evicted_bytes > SIGNIFICANT_LOG_THRESHOLD:
-                logger.debug(f"Large eviction: {evicted_bytes} bytes, buffer now {self.total_bytes} bytes")
+                logger.debug("Large eviction: %d bytes, buffer now %d bytes", evicted_bytes, self.total_bytes)
 
             # Signal data availability only if buffer has data
             if self.chunks:
@@ -74,7 +74,7 @@ class CircularBuffer:
             if result:
                 total_drained = sum(len(chunk) for chunk in result)
                 if total_drained > SIGNIFICANT_LOG_THRESHOLD:
-                    logger.debug(f"Large drain: {len(result)} chunks ({total_drained} bytes)")
+                    logger.debug("Large drain: %d chunks (%d bytes)", len(result), total_drained)
 
             return result
 
@@ -111,7 +111,7 @@ class CircularBuffer:
             self._data_available.clear()
 
             if cleared_bytes > SIGNIFICANT_LOG_THRESHOLD:
-                logger.debug(f"Large clear: {cleared_bytes} bytes from buffer")
+                logger.debug("Large clear: %d bytes from buffer", cleared_bytes)
 
     @staticmethod
     def to_bytes(chunks: list[bytes]) -> bytes:
@@ -5,6 +5,7 @@ import errno
 import fcntl
 import os
 import pty
+import re
 import termios
 
 from ..config.constants import LARGE_IO_THRESHOLD
@@ -14,6 +15,9 @@ from .models import PTYError
 
 logger = get_logger("pty_handler")
 
+# Characters a shell would interpret; rejected anywhere in a command argument
+_SHELL_METACHARACTERS_RE = re.compile(r"[;&|$`\n\r]")
+
 
 class PTYHandler:
     """Handles PTY creation and I/O operations for terminal emulation."""
@@ -46,13 +50,13 @@ class PTYHandler:
             )
 
         for i, arg in enumerate(command):
-            if any(char in arg for char in [";", "&", "|", "$", "`", "\n", "\r"]):
+            if _SHELL_METACHARACTERS_RE.search(arg):
                 raise PTYError(f"Command argument {i} contains shell metacharacters which are not allowed: {arg!r}")
 
-            if arg.startswith(">") or arg.startswith("<"):
+            if arg.startswith((">", "<")):
                 raise PTYError(f"Command argument {i} contains redirection operators which are not allowed: {arg!r}")
 
-        logger.debug(f"Command validation passed for: {' '.join(command)}")
+        logger.debug("Command validation passed for: %s", command)
 
     async def __aenter__(self) -> "PTYHandler":
         """Async context manager entry."""
@@ -75,7 +79,7 @@ class PTYHandler:
             self._validate_command(command)
 
             self.master_fd, self.slave_fd = pty.openpty()
-            logger.debug(f"Created PTY pair: master={self.master_fd}, slave={self.slave_fd}")
+            logger.debug("Created PTY pair: master=%s, slave=%s", self.master_fd, self.slave_fd)
 
             # Configure terminal settings
             self._configure_terminal()
@@ -111,7 +115,7 @@ class PTYHandler:
             if self.slave_fd is not None:
                 self._before_slave_close(self.slave_fd)
                 os.close(self.slave_fd)
-                logger.debug(f"Closed slave FD {self.slave_fd} in parent process")
+                logger.debug("Closed slave FD %s in parent process", self.slave_fd)
                 self.slave_fd = None
 
         except OSError as e:
@@ -170,7 +174,7 @@ class PTYHandler:
             if bytes_written != len(data):
                 logger.warning(f"Partial write: {bytes_written}/{len(data)} bytes")
             elif bytes_written > LARGE_IO_THRESHOLD:
-                logger.debug(f"Large write: {bytes_written} bytes to PTY")
+                logger.debug("Large write: %d bytes to PTY", bytes_written)
 
         except (OSError, BrokenPipeError) as e:
             raise PTYError(f"Failed to write to PTY: {e}") from e
@@ -190,7 +194,7 @@ class PTYHandler:
             # Direct read from non-blocking FD - no threading needed
             data = os.read(self.master_fd, size)
             if data and len(data) > LARGE_IO_THRESHOLD:
-                logger.debug(f"Large read: {len(data)} bytes from PTY")
+                logger.debug("Large read: %d bytes from PTY", len(data))
             return data
 
         except BlockingIOError:
@@ -101,7 +101,7 @@ class InteractiveSession:
     def state(self, value: SessionState) -> None:
         """Set session state with logging."""
         if self._state != value:
-            logger.debug(f"Session {self.session_id} state change: {self._state.value} -> {value.value}")
+            logger.debug("Session %s state change: %s -> %s", self.session_id, self._state.value, value.value)
             self._state = value
 
     async def __aenter__(self) -> "InteractiveSession":
@@ -187,7 +187,7 @@ class InteractiveSession:
             self.total_commands_executed += 1
             self.last_activity = datetime.now()
 
-            logger.debug(f"Queued command {self.command_count} for session {self.session_id}: {command.strip()}")
+            logger.debug("Queued command %d for session %s: %s", self.command_count, self.session_id, command.strip())
 
         except Exception as e:
             raise SessionError(f"Failed to send command: {e}", self.session_id) from e
@@ -258,7 +258,7 @@ class InteractiveSession:
             )
 
             if execution_time > SLOW_OPERATION_THRESHOLD or len(output) > LARGE_IO_THRESHOLD:
-                logger.debug(f"Read {len(output)} chars from session {self.session_id} in {execution_time:.3f}s")
+                logger.debug("Read %d chars from session %s in %.3fs", len(output), self.session_id, execution_time)
 
             return result
 
@@ -315,7 +315,7 @@ class InteractiveSession:
 
     async def cleanup(self) -> None:
         """Clean up session resources."""
-        logger.debug(f"Cleaning up session {self.session_id}")
+        logger.debug("Cleaning up session %s", self.session_id)
 
         if self.state not in (SessionState.TERMINATED, SessionState.ERROR):
             self.state = SessionState.TERMINATED
@@ -330,11 +330,11 @@ class InteractiveSession:
         # Clear buffer
         await self.output_buffer.clear()
 
-        logger.debug(f"Session {self.session_id} cleanup completed")
+        logger.debug("Session %s cleanup completed", self.session_id)
 
     async def _read_output(self) -> None:
         """Background task to read PTY output."""
-        logger.debug(f"Started output reader for session {self.session_id}")
+        logger.debug("Started output reader for session %s", self.session_id)
 
         try:
             while not self._shutdown_event.is_set() and self.pty.is_process_alive():
@@ -355,11 +355,11 @@ class InteractiveSession:
                     break
 
         finally:
-            logger.debug(f"Output reader ended for session {self.session_id}")
+            logger.debug("Output reader ended for session %s", self.session_id)
 
     async def _write_input(self) -> None:
         """Background task to write commands to PTY."""
-        logger.debug(f"Started input writer for session {self.session_id}")
+        logger.debug("Started input writer for session %s", self.session_id)
 
         try:
             while not self._shutdown_event.is_set():
@@ -378,11 +378,11 @@ class InteractiveSession:
                     break
 
         finally:
-            logger.debug(f"Input writer ended for session {self.session_id}")
+            logger.debug("Input writer ended for session %s", self.session_id)
 
     async def _monitor_exit(self) -> None:
         """Background task to monitor process exit."""
-        logger.debug(f"Started exit monitor for session {self.session_id}")
+        logger.debug("Started exit monitor for session %s", self.session_id)
 
         try:
             # Wait for process to exit
@@ -400,7 +400,7 @@ class InteractiveSession:
                 self.state = SessionState.TERMINATED
                 self._shutdown_event.set()
         finally:
-            logger.debug(f"Exit monitor ended for session {self.session_id}")
+            logger.debug("Exit monitor ended for session %s", self.session_id)
 
     def _detect_openroad_errors(self, output: str) -> str | None:
         """Detect OpenROAD error patterns in command output.
@@ -578,7 +578,7 @@ class InteractiveSession:
                     # Process may not exist or we don't have access
                     pass
         except Exception as e:
-            logger.debug(f"Error updating performance metrics for session {self.session_id}: {e}")
+            logger.debug("Error updating performance metrics for session %s: %s", self.session_id, e)
 
     async def _get_current_memory_usage(self) -> float:
         """Get current memory usage in MB."""
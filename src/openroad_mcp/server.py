@@ -18,7 +18,7 @@ from .tools.interactive import (
     SessionMetricsTool,
     TerminateSessionTool,
 )
-from .tools.report_images import ListReportImagesTool, ReadReportImageTool
+from .tools.report_images import ListReportImagesTool, ReadReportImagesBulkTool, ReadReportImageTool
 from .utils.cleanup import cleanup_manager
 from .utils.logging import get_logger
 
@@ -43,6 +43,7 @@ session_metrics_tool = SessionMetricsTool(manager)
 # Initialize report image tool instances
 list_report_images_tool = ListReportImagesTool(manager)
 read_report_image_tool = ReadReportImageTool(manager)
+read_report_images_bulk_tool = ReadReportImagesBulkTool(manager)
 
 
 # Interactive session tools
@@ -198,6 +199,19 @@ async def read_report_image(platform: str, design: str, run_slug: str, image_nam
     return await read_report_image_tool.execute(platform, design, run_slug, image_name)
 
 
+@mcp.tool(
+    annotations=ToolAnnotations(
+        readOnlyHint=True,
+        destructiveHint=False,
+        idempotentHint=True,
+        openWorldHint=False,
+    )
+)
+async def read_report_images(platform: str, design: str, run_slug: str, image_names: list[str]) -> str:
+    """Read several report images from one run and return base64-encoded data with metadata for each."""
+    return await read_report_images_bulk_tool.execute(platform, design, run_slug, image_names)
+
+
 async def shutdown_openroad() -> None:
     """Gracefully shutdown interactive OpenROAD sessions."""
     try:
@@ -16,6 +16,7 @@ from ..core.models import (
     ProcessRestartResult,
     ProcessStatus,
     ReadImageResult,
+    ReadImagesResult,
     SessionHistoryResult,
     SessionInspectionResult,
     SessionMetricsResult,
@@ -51,6 +52,7 @@ class BaseTool(ABC):
             | SessionMetricsResult
             | ListImagesResult
             | ReadImageResult
+            | ReadImagesResult
         ),
     ) -> str:
         """Format result as JSON string."""
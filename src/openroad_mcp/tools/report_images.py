@@ -1,15 +1,25 @@
 """Report image reading tools for OpenROAD MCP server."""
 
+import asyncio
 import base64
+import functools
 import io
-from datetime import datetime
+import itertools
+import multiprocessing
+import os
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 
 from PIL import Image
 
+from ..config.constants import VALIDATION_CACHE_TTL_SECONDS
 from ..config.settings import settings
 from ..core.exceptions import ValidationError
-from ..core.models import ImageInfo, ImageMetadata, ListImagesResult, ReadImageResult
+from ..core.models import ImageInfo, ImageMetadata, ListImagesResult, ReadImageResult, ReadImagesResult
+from ..utils.cleanup import cleanup_manager
 from ..utils.logging import get_logger
 from ..utils.path_security import validate_path_segment, validate_safe_path_containment
 from .base import BaseTool
@@ -18,6 +28,9 @@ logger = get_logger("report_images")
 
 MAX_BASE64_SIZE_KB = 15
 MAX_IMAGE_SIZE_MB = 50
+MAX_BULK_IMAGES = 32
+BULK_PROCESS_POOL_MIN_IMAGES = 4
+MAX_LISTED_ALTERNATIVES = 20
 
 IMAGE_TYPE_MAPPING = {
     "cts_clk": "clock_visualization",
@@ -45,6 +58,38 @@ def classify_image_type(filename: str) -> tuple[str, str]:
     return stage, image_type
 
 
+def _iso_mtime(timestamp: float) -> str:
+    """Format a file mtime as a local ISO 8601 timestamp with second resolution."""
+    t = time.localtime(timestamp)
+    return f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+
+
+def _scan_webps(root: str) -> Iterator[os.DirEntry[str]]:
+    """Recursively yield .webp entries under root using os.scandir.
+
+    Directories that cannot be read are skipped, as Path.rglob does.
+    """
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scan_webps(entry.path)
+                elif entry.name.endswith(".webp") and entry.is_file():
+                    yield entry
+    except OSError as e:
+        logger.debug("Skipping unreadable directory %s: %s", root, e)
+
+
+def _format_available(names: Iterable[str], limit: int = MAX_LISTED_ALTERNATIVES) -> str:
+    """Join at most limit names for an error message without exhausting the iterable."""
+    shown = list(itertools.islice(names, limit + 1))
+    if not shown:
+        return "none"
+    if len(shown) > limit:
+        return f"{', '.join(shown[:limit])} (showing first {limit})"
+    return ", ".join(shown)
+
+
 def _resolve_run_path(platform: str, design: str, run_slug: str) -> tuple[Path, Path]:
     """Validate inputs and return (reports_base, run_path)."""
     validate_platform_design(platform, design)
@@ -55,51 +100,173 @@ def _resolve_run_path(platform: str, design: str, run_slug: str) -> tuple[Path,
     return reports_base, run_path
 
 
+@functools.lru_cache(maxsize=256)
+def _platform_design_error(flow_path: Path, platform: str, design: str, epoch: int) -> str | None:
+    """Return why platform/design is invalid, or None if both exist.
+
+    flow_path and epoch only key the cache: a settings reload changes the former,
+    and the latter rolls over every VALIDATION_CACHE_TTL_SECONDS so new platforms
+    and designs on disk are picked up.
+    """
+    platforms = settings.platforms
+    if platform not in platforms:
+        return f"Platform '{platform}' not found. Available: {', '.join(sorted(platforms)) or 'none'}"
+
+    designs = settings.designs(platform)
+    if design not in designs:
+        available = ", ".join(sorted(designs)) or "none"
+        return f"Design '{design}' not found for platform '{platform}'. Available: {available}"
+    return None
+
+
 def validate_platform_design(platform: str, design: str) -> None:
     """Validate platform and design exist in ORFS structure."""
-    if platform not in settings.platforms:
-        raise ValidationError(
-            f"Platform '{platform}' not found. Available: {', '.join(sorted(settings.platforms)) or 'none'}"
-        )
+    epoch = int(time.monotonic() // VALIDATION_CACHE_TTL_SECONDS)
+    error = _platform_design_error(settings.flow_path, platform, design, epoch)
+    if error is not None:
+        raise ValidationError(error)
+
+
+def _webp_dims(data: bytes) -> tuple[int, int] | None:
+    """Extract (width, height) from a WEBP container header without decoding.
 
-    if design not in settings.designs(platform):
-        raise ValidationError(
-            f"Design '{design}' not found for platform '{platform}'. "
-            f"Available: {', '.join(sorted(settings.designs(platform))) or 'none'}"
+    Handles the three RIFF chunk layouts defined by the libwebp container spec
+    (VP8X extended, VP8L lossless, VP8 lossy). Returns None on any mismatch so
+    callers can fall back to PIL.
+    """
+    if len(data) < 30 or data[:4] != b"RIFF" or data[8:12] != b"WEBP":
+        return None
+
+    chunk = data[12:16]
+    if chunk == b"VP8X":
+        width = int.from_bytes(data[24:27], "little") + 1
+        height = int.from_bytes(data[27:30], "little") + 1
+        return width, height
+    if chunk == b"VP8L":
+        if data[20] != 0x2F:
+            return None
+        bits = int.from_bytes(data[21:25], "little")
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8 ":
+        if data[23:26] != b"\x9d\x01\x2a":
+            return None
+        width = int.from_bytes(data[26:28], "little") & 0x3FFF
+        height = int.from_bytes(data[28:30], "little") & 0x3FFF
+        return width, height
+    return None
+
+
+_compression_pool: ProcessPoolExecutor | None = None
+
+
+def _get_compression_pool() -> ProcessPoolExecutor:
+    """Return the shared image compression pool, starting it on first use."""
+    global _compression_pool
+    if _compression_pool is None:
+        _compression_pool = ProcessPoolExecutor(
+            max_workers=min(MAX_BULK_IMAGES, os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context("forkserver"),
         )
+    return _compression_pool
+
+
+def _shutdown_compression_pool() -> None:
+    """Stop the shared compression pool without waiting for its workers to exit."""
+    global _compression_pool
+    pool, _compression_pool = _compression_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+cleanup_manager.register_cleanup_handler(_shutdown_compression_pool)
+
+
+def _exceeds_b64_threshold(size_bytes: int, max_size_kb: int = MAX_BASE64_SIZE_KB) -> bool:
+    """Return whether a file of size_bytes would exceed max_size_kb once base64-encoded."""
+    return (size_bytes * 4) // 3 > max_size_kb * 1024
+
+
+def _needs_compression(image_path: Path) -> bool:
+    """Return whether load_and_compress_image would have to re-encode image_path."""
+    try:
+        return _exceeds_b64_threshold(image_path.stat().st_size)
+    except OSError:
+        # Let load_and_compress_image report the error for this image
+        return False
+
+
+async def _load_images_parallel(
+    image_paths: list[Path],
+) -> list[tuple[bytes, bool, int, int, int | None, int | None, int | None, int | None] | BaseException]:
+    """Run load_and_compress_image over several images concurrently.
+
+    Images under the size threshold are only read from disk, so they run in a
+    thread. Images that need compression also run in threads (Pillow releases
+    the GIL while resizing and encoding) unless there are enough of them to pay
+    for the shared process pool, which compresses on every core.
+    Failures are returned in place of the result for the affected image.
+    """
+    loop = asyncio.get_running_loop()
+    oversized = {path for path in image_paths if _needs_compression(path)}
+    pool = _get_compression_pool() if len(oversized) >= BULK_PROCESS_POOL_MIN_IMAGES else None
+
+    results = await asyncio.gather(
+        *(
+            loop.run_in_executor(pool, load_and_compress_image, path)
+            if pool is not None and path in oversized
+            else asyncio.to_thread(load_and_compress_image, path)
+            for path in image_paths
+        ),
+        return_exceptions=True,
+    )
+
+    if any(isinstance(result, BrokenProcessPool) for result in results):
+        # A worker died; drop the pool so the next call starts a fresh one
+        _shutdown_compression_pool()
+
+    return results
 
 
 def load_and_compress_image(
-    image_path: Path, max_size_kb: int = MAX_BASE64_SIZE_KB
+    image_path: Path,
+    max_size_kb: int = MAX_BASE64_SIZE_KB,
+    resample: Image.Resampling | None = None,
 ) -> tuple[bytes, bool, int, int, int | None, int | None, int | None, int | None]:
     """Load image and compress if base64-encoded size would exceed threshold.
 
+    Images already under the threshold are returned as-is; their dimensions come
+    from the WEBP header, with PIL only used when the header cannot be parsed.
+
     Compression strategy:
     - Threshold: 15KB base64 (~11KB binary) balances quality vs MCP message size
-    - Resampling: LANCZOS provides best quality during downscaling
+    - Resampling: LANCZOS when keeping more than half the original scale, BICUBIC
+      for heavier downscaling where it is visually equivalent and about twice as
+      fast; pass resample to force a specific filter
     - Format: WEBP with quality=85 for good compression with minimal artifacts
     - Minimum dimensions: 256px preserves readability of chip layout visualizations
     """
     original_size = image_path.stat().st_size
-    estimated_b64_size = (original_size * 4) // 3
+
+    if not _exceeds_b64_threshold(original_size, max_size_kb):
+        with open(image_path, "rb") as f:
+            data = f.read()
+
+        dims = _webp_dims(data)
+        if dims is None:
+            try:
+                with Image.open(image_path) as img:
+                    dims = img.size
+            except Exception as e:
+                logger.warning(f"Failed to process image with PIL: {e}. Reading as raw bytes.")
+                return data, False, original_size, original_size, None, None, None, None
+
+        width, height = dims
+        return data, False, original_size, original_size, width, height, width, height
 
     try:
         with Image.open(image_path) as img:
             original_width, original_height = img.size
 
-            if estimated_b64_size <= max_size_kb * 1024:
-                with open(image_path, "rb") as f:
-                    return (
-                        f.read(),
-                        False,
-                        original_size,
-                        original_size,
-                        original_width,
-                        original_height,
-                        original_width,
-                        original_height,
-                    )
-
             logger.info(f"Image {image_path.name} ({original_size} bytes) exceeds threshold, compressing...")
 
             target_bytes = max_size_kb * 1024 * 3 // 4
@@ -110,7 +277,9 @@ def load_and_compress_image(
 
             logger.info(f"Resizing from {original_width}x{original_height} to {new_width}x{new_height}")
 
-            resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            if resample is None:
+                resample = Image.Resampling.LANCZOS if scale > 0.5 else Image.Resampling.BICUBIC
+            resized = img.resize((new_width, new_height), resample)
 
             buffer = io.BytesIO()
             resized.save(buffer, format="WEBP", quality=85)
@@ -153,34 +322,41 @@ class ListReportImagesTool(BaseTool):
                     )
                 )
 
-            webp_files = list(run_path.rglob("*.webp"))
+            run_path_str = os.fspath(run_path)
+            webp_entries = list(_scan_webps(run_path_str))
 
-            if not webp_files:
-                logger.warning(f"No webp images found in {run_path}")
+            if not webp_entries:
+                logger.warning(f"No webp images found in {run_path_str}")
                 return self._format_result(
                     ListImagesResult(
-                        run_path=str(run_path),
+                        run_path=run_path_str,
                         total_images=0,
                         images_by_stage={},
-                        message=f"No webp images found in {run_path}",
+                        message=f"No webp images found in {run_path_str}",
                     )
                 )
 
             images_by_stage: dict[str, list[ImageInfo]] = {}
 
-            for webp_file in webp_files:
-                file_stage, file_type = classify_image_type(webp_file.name)
+            # Cheap prefix test so filtered-out files skip classification; "unknown" has no prefix
+            stage_prefix = None if stage in ("all", "unknown") else f"{stage}_"
+
+            for entry in webp_entries:
+                if stage_prefix is not None and not entry.name.startswith(stage_prefix):
+                    continue
+
+                file_stage, file_type = classify_image_type(entry.name)
 
                 if stage != "all" and file_stage != stage:
                     continue
 
-                stat = webp_file.stat()
+                stat = entry.stat()
 
                 image_info = ImageInfo(
-                    filename=webp_file.name,
-                    path=str(webp_file),
+                    filename=entry.name,
+                    path=entry.path,
                     size_bytes=stat.st_size,
-                    modified_time=datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                    modified_time=_iso_mtime(stat.st_mtime),
                     type=file_type,
                 )
 
@@ -194,7 +370,7 @@ class ListReportImagesTool(BaseTool):
             total_images = sum(len(images) for images in images_by_stage.values())
 
             result = ListImagesResult(
-                run_path=str(run_path),
+                run_path=run_path_str,
                 total_images=total_images,
                 images_by_stage=images_by_stage,
             )
@@ -212,6 +388,91 @@ class ListReportImagesTool(BaseTool):
             )
 
 
+def _validate_image_name(image_name: str) -> None:
+    """Validate a report image filename."""
+    validate_path_segment(image_name, "image_name")
+
+    if not image_name.endswith(".webp"):
+        raise ValidationError(f"Image filename must have .webp extension: {image_name}")
+
+
+def _locate_image(run_path: Path, image_name: str) -> Path | ReadImageResult:
+    """Return the path of a readable image in run_path, or an error result explaining why it is not."""
+    image_path = run_path / image_name
+
+    validate_safe_path_containment(image_path, run_path, "image file")
+
+    if not image_path.exists():
+        logger.warning(f"Image not found: {image_name}")
+        available_images = _format_available(entry.name for entry in _scan_webps(os.fspath(run_path)))
+        return ReadImageResult(
+            error="ImageNotFound",
+            message=f"Image '{image_name}' not found in {run_path}. "
+            f"Available images: {available_images}. "
+            "Use list_report_images to see all available images.",
+        )
+
+    if not image_path.is_file():
+        logger.warning(f"Image path is not a file: {image_path}")
+        return ReadImageResult(
+            error="InvalidImagePath",
+            message=f"Image path {image_name} is not a regular file.",
+        )
+
+    file_size_mb = image_path.stat().st_size / (1024 * 1024)
+    if file_size_mb > MAX_IMAGE_SIZE_MB:
+        logger.warning(f"Image too large: {file_size_mb:.2f}MB > {MAX_IMAGE_SIZE_MB}MB")
+        return ReadImageResult(
+            error="FileTooLarge",
+            message=f"Image size ({file_size_mb:.2f}MB) exceeds maximum allowed size ({MAX_IMAGE_SIZE_MB}MB).",
+        )
+
+    return image_path
+
+
+def _build_image_result(
+    image_path: Path,
+    image_name: str,
+    loaded: tuple[bytes, bool, int, int, int | None, int | None, int | None, int | None],
+) -> ReadImageResult:
+    """Base64-encode a loaded image and attach its metadata."""
+    (
+        image_bytes,
+        compression_applied,
+        original_size,
+        compressed_size,
+        original_width,
+        original_height,
+        width,
+        height,
+    ) = loaded
+
+    image_data_b64 = base64.b64encode(image_bytes).decode("utf-8")
+
+    stat = image_path.stat()
+    file_stage, file_type = classify_image_type(image_name)
+
+    compression_ratio = compressed_size / original_size if compression_applied else None
+
+    metadata = ImageMetadata(
+        filename=image_name,
+        format="webp",
+        size_bytes=compressed_size,
+        width=width,
+        height=height,
+        modified_time=_iso_mtime(stat.st_mtime),
+        stage=file_stage,
+        type=file_type,
+        compression_applied=compression_applied,
+        original_size_bytes=original_size if compression_applied else None,
+        original_width=original_width if compression_applied else None,
+        original_height=original_height if compression_applied else None,
+        compression_ratio=compression_ratio,
+    )
+
+    return ReadImageResult(image_data=image_data_b64, metadata=metadata)
+
+
 class ReadReportImageTool(BaseTool):
     """Tool for reading report images and returning base64-encoded data with metadata."""
 
@@ -219,10 +480,7 @@ class ReadReportImageTool(BaseTool):
         """Read a specific report image and return base64-encoded data."""
         try:
             reports_base, run_path = _resolve_run_path(platform, design, run_slug)
-            validate_path_segment(image_name, "image_name")
-
-            if not image_name.endswith(".webp"):
-                raise ValidationError(f"Image filename must have .webp extension: {image_name}")
+            _validate_image_name(image_name)
 
             if not run_path.exists():
                 logger.warning(f"Run slug not found: {run_slug}")
@@ -234,88 +492,83 @@ class ReadReportImageTool(BaseTool):
                     )
                 )
 
-            image_path = run_path / image_name
+            located = _locate_image(run_path, image_name)
+            if isinstance(located, ReadImageResult):
+                return self._format_result(located)
 
-            validate_safe_path_containment(image_path, run_path, "image file")
+            result = _build_image_result(located, image_name, load_and_compress_image(located))
 
-            if not image_path.exists():
-                logger.warning(f"Image not found: {image_name}")
-                available_images = [f.name for f in run_path.rglob("*.webp")]
-                return self._format_result(
-                    ReadImageResult(
-                        error="ImageNotFound",
-                        message=f"Image '{image_name}' not found in {run_path}. "
-                        f"Available images: {', '.join(available_images) if available_images else 'none'}. "
-                        "Use list_report_images to see all available images.",
-                    )
+            return self._format_result(result)
+        except ValidationError as e:
+            return self._format_result(ReadImageResult(error=type(e).__name__, message=str(e)))
+        except Exception as e:
+            logger.exception(f"Failed to read report image: {e}")
+            return self._format_result(
+                ReadImageResult(
+                    error="UnexpectedError",
+                    message=f"Failed to read report image: {str(e)}",
                 )
+            )
 
-            if not image_path.is_file():
-                logger.warning(f"Image path is not a file: {image_path}")
-                return self._format_result(
-                    ReadImageResult(
-                        error="InvalidImagePath",
-                        message=f"Image path {image_name} is not a regular file.",
-                    )
-                )
-            file_size_mb = image_path.stat().st_size / (1024 * 1024)
-            if file_size_mb > MAX_IMAGE_SIZE_MB:
-                logger.warning(f"Image too large: {file_size_mb:.2f}MB > {MAX_IMAGE_SIZE_MB}MB")
+
+class ReadReportImagesBulkTool(BaseTool):
+    """Tool for reading several report images from one run, compressing them in parallel."""
+
+    async def execute(self, platform: str, design: str, run_slug: str, image_names: list[str]) -> str:
+        """Read multiple report images and return base64-encoded data for each."""
+        try:
+            reports_base, run_path = _resolve_run_path(platform, design, run_slug)
+
+            if not image_names:
+                raise ValidationError("image_names cannot be empty")
+            if len(image_names) > MAX_BULK_IMAGES:
+                raise ValidationError(f"Too many images requested ({len(image_names)} > {MAX_BULK_IMAGES})")
+
+            if not run_path.exists():
+                logger.warning(f"Run slug not found: {run_slug}")
                 return self._format_result(
-                    ReadImageResult(
-                        error="FileTooLarge",
-                        message=f"Image size ({file_size_mb:.2f}MB) exceeds maximum "
-                        f"allowed size ({MAX_IMAGE_SIZE_MB}MB).",
+                    ReadImagesResult(
+                        error="RunSlugNotFound",
+                        message=f"Run slug '{run_slug}' not found in {reports_base}. "
+                        "Use list_report_images to see available runs.",
                     )
                 )
 
-            (
-                image_bytes,
-                compression_applied,
-                original_size,
-                compressed_size,
-                original_width,
-                original_height,
-                width,
-                height,
-            ) = load_and_compress_image(image_path)
-
-            image_data_b64 = base64.b64encode(image_bytes).decode("utf-8")
-
-            stat = image_path.stat()
-            file_stage, file_type = classify_image_type(image_name)
-
-            compression_ratio = compressed_size / original_size if compression_applied else None
-
-            metadata = ImageMetadata(
-                filename=image_name,
-                format="webp",
-                size_bytes=compressed_size,
-                width=width,
-                height=height,
-                modified_time=datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                stage=file_stage,
-                type=file_type,
-                compression_applied=compression_applied,
-                original_size_bytes=original_size if compression_applied else None,
-                original_width=original_width if compression_applied else None,
-                original_height=original_height if compression_applied else None,
-                compression_ratio=compression_ratio,
-            )
-
-            result = ReadImageResult(
-                image_data=image_data_b64,
-                metadata=metadata,
-            )
-
-            return self._format_result(result)
+            results: list[ReadImageResult | None] = []
+            pending: dict[int, Path] = {}
+            for image_name in image_names:
+                try:
+                    _validate_image_name(image_name)
+                    located = _locate_image(run_path, image_name)
+                except ValidationError as e:
+                    located = ReadImageResult(error=type(e).__name__, message=str(e))
+
+                if isinstance(located, ReadImageResult):
+                    results.append(located)
+                else:
+                    pending[len(results)] = located
+                    results.append(None)
+
+            if pending:
+                loaded = await _load_images_parallel(list(pending.values()))
+                for (index, image_path), item in zip(pending.items(), loaded, strict=True):
+                    if isinstance(item, BaseException):
+                        logger.warning(f"Failed to read report image {image_path.name}: {item}")
+                        results[index] = ReadImageResult(
+                            error="UnexpectedError",
+                            message=f"Failed to read report image: {str(item)}",
+                        )
+                    else:
+                        results[index] = _build_image_result(image_path, image_names[index], item)
+
+            return self._format_result(ReadImagesResult(images=[r for r in results if r is not None]))
         except ValidationError as e:
-            return self._format_result(ReadImageResult(error=type(e).__name__, message=str(e)))
+            return self._format_result(ReadImagesResult(error=type(e).__name__, message=str(e)))
         except Exception as e:
-            logger.exception(f"Failed to read report image: {e}")
+            logger.exception(f"Failed to read report images: {e}")
             return self._format_result(
-                ReadImageResult(
+                ReadImagesResult(
                     error="UnexpectedError",
-                    message=f"Failed to read report image: {str(e)}",
+                    message=f"Failed to read report images: {str(e)}",
                 )
             )
@@ -1,6 +1,26 @@
 """ANSI escape code decoder for human-readable terminal output."""
 
+import functools
 import re
+from collections import Counter
+
+_ESCAPE_RE = re.compile(r"\x1b\[[0-9;?]*[a-zA-Z]")
+_OPENROAD_PROMPT_RE = re.compile(r"openroad>\s*")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n")
+
+
+def _strip_ansi(text: str) -> str:
+    """Remove escape sequences and turn carriage returns into newlines.
+
+    Every character-level scan here runs in C (the compiled regex and str
+    methods); the regex and carriage-return passes are skipped when a cheap
+    substring probe shows there is nothing for them to do.
+    """
+    if "\x1b" in text:
+        text = _ESCAPE_RE.sub("", text)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
 
 class ANSIDecoder:
@@ -70,34 +90,7 @@ class ANSIDecoder:
         Returns:
             Human-readable description of the escape sequence
         """
-        # Check exact matches first using the actual escape characters
-        for pattern, description in ANSIDecoder.ESCAPE_SEQUENCES.items():
-            if re.match(pattern, sequence):
-                return description
-
-        # Handle specific bracketed paste mode sequences
-        if "?2004h" in sequence:
-            return "Enable bracketed paste mode"
-        elif "?2004l" in sequence:
-            return "Disable bracketed paste mode"
-
-        # Handle generic patterns
-        if sequence.startswith("\x1b["):
-            if "?" in sequence:
-                if sequence.endswith("h"):
-                    return f"Enable terminal mode ({sequence})"
-                elif sequence.endswith("l"):
-                    return f"Disable terminal mode ({sequence})"
-            elif sequence.endswith("m"):
-                return f"Text formatting ({sequence})"
-            elif any(c in sequence for c in "ABCD"):
-                return f"Cursor movement ({sequence})"
-            elif "H" in sequence or "f" in sequence:
-                return f"Cursor positioning ({sequence})"
-            elif "J" in sequence or "K" in sequence:
-                return f"Clear operation ({sequence})"
-
-        return f"Unknown escape sequence ({sequence})"
+        return _decode_escape_sequence(sequence)
 
     @staticmethod
     def translate_output(text: str, mode: str = "annotate") -> str:
@@ -117,44 +110,40 @@ class ANSIDecoder:
         if not text:
             return text
 
-        # Find all ANSI escape sequences
-        escape_pattern = r"\x1b\[[0-9;?]*[a-zA-Z]"
-        sequences = re.findall(escape_pattern, text)
+        # Piped or redirected output usually carries no escapes at all
+        has_escapes = "\x1b" in text
 
         if mode == "remove":
-            # Simply remove all escape sequences
-            result = re.sub(escape_pattern, "", text)
-            # Also clean up common control characters
-            result = result.replace("\r\n", "\n").replace("\r", "\n")
-            return result
-
-        elif mode == "annotate":
-            # Replace escape sequences with human-readable annotations
-            result = text
-            for seq in set(sequences):  # Use set to avoid duplicate processing
-                description = ANSIDecoder.decode_escape_sequence(seq)
-                annotation = f"[{description}]"
-                result = result.replace(seq, annotation)
-
-            # Clean up control characters
-            result = result.replace("\r\n", "\n").replace("\r", "")
-            return result
-
-        elif mode == "preserve":
-            # Keep sequences but add annotations
-            result = text
-            for seq in set(sequences):
-                description = ANSIDecoder.decode_escape_sequence(seq)
-                annotation = f"{seq}[{description}]"
-                result = result.replace(seq, annotation)
+            return _strip_ansi(text)
+
+        elif mode in ("annotate", "preserve"):
+            # Emit each annotation as the regex walks the text, formatting every
+            # distinct sequence once instead of re-scanning the text per sequence
+            annotations: dict[str, str] = {}
+
+            def annotate(match: re.Match[str]) -> str:
+                seq = match.group()
+                annotation = annotations.get(seq)
+                if annotation is None:
+                    description = _decode_escape_sequence(seq)
+                    annotation = f"[{description}]" if mode == "annotate" else f"{seq}[{description}]"
+                    annotations[seq] = annotation
+                return annotation
+
+            result = _ESCAPE_RE.sub(annotate, text) if has_escapes else text
+
+            if mode == "annotate":
+                # Clean up control characters
+                result = result.replace("\r\n", "\n").replace("\r", "")
             return result
 
         elif mode == "decode":
             # Show detailed breakdown
             lines = [text, "\n--- ANSI Escape Sequence Breakdown ---"]
-            for seq in set(sequences):
-                description = ANSIDecoder.decode_escape_sequence(seq)
-                lines.append(f"{repr(seq)} -> {description}")
+            if has_escapes:
+                for seq in dict.fromkeys(match.group() for match in _ESCAPE_RE.finditer(text)):
+                    description = _decode_escape_sequence(seq)
+                    lines.append(f"{repr(seq)} -> {description}")
             return "\n".join(lines)
 
         else:
@@ -174,17 +163,14 @@ class ANSIDecoder:
             return output
 
         # Remove ANSI escape sequences
-        cleaned = ANSIDecoder.translate_output(output, mode="remove")
-
-        # Clean up OpenROAD-specific patterns
-        # Remove prompt artifacts
-        cleaned = re.sub(r"openroad>\s*", "", cleaned)
+        cleaned = _strip_ansi(output)
 
-        # Clean up extra whitespace and line breaks
-        cleaned = re.sub(r"\n\s*\n", "\n", cleaned)  # Remove empty lines
-        cleaned = cleaned.strip()
+        # Separate passes on purpose: each pattern starts with a literal the regex
+        # engine can search for quickly, which an alternation of the two loses
+        cleaned = _OPENROAD_PROMPT_RE.sub("", cleaned)  # Remove prompt artifacts
+        cleaned = _BLANK_LINES_RE.sub("\n", cleaned)  # Remove empty lines
 
-        return cleaned
+        return cleaned.strip()
 
     @staticmethod
     def get_sequence_stats(text: str) -> dict[str, int]:
@@ -196,13 +182,82 @@ class ANSIDecoder:
         Returns:
             Dictionary with sequence counts and descriptions
         """
-        escape_pattern = r"\x1b\[[0-9;?]*[a-zA-Z]"
-        sequences = re.findall(escape_pattern, text)
-
-        stats: dict[str, int] = {}
-        for seq in sequences:
-            description = ANSIDecoder.decode_escape_sequence(seq)
-            key = f"{repr(seq)} ({description})"
-            stats[key] = stats.get(key, 0) + 1
-
-        return stats
+        if "\x1b" not in text:
+            return {}
+
+        # Count raw sequences in C, then format one key per distinct sequence
+        counts = Counter(match.group() for match in _ESCAPE_RE.finditer(text))
+        return {_sequence_label(seq): count for seq, count in counts.items()}
+
+
+def _split_escape_sequences(
+    table: dict[str, str],
+) -> tuple[dict[str, str], list[tuple[re.Pattern[str], str]]]:
+    """Split the escape table into literal sequences and compiled parametric patterns.
+
+    A literal entry only goes in the exact-match dict if no earlier parametric
+    pattern would have matched it, so lookup order matches a linear scan.
+    """
+    exact: dict[str, str] = {}
+    parametric: list[tuple[re.Pattern[str], str]] = []
+    for pattern, description in table.items():
+        stripped = pattern.replace(r"\x1b", "").replace(r"\[", "").replace(r"\?", "")
+        if any(char in stripped for char in "\\.^$*+?{}[]|()"):
+            parametric.append((re.compile(pattern), description))
+            continue
+
+        literal = pattern.replace(r"\x1b", "\x1b").replace(r"\[", "[").replace(r"\?", "?")
+        if literal not in exact and not any(compiled.match(literal) for compiled, _ in parametric):
+            exact[literal] = description
+        else:
+            parametric.append((re.compile(pattern), description))
+    return exact, parametric
+
+
+@functools.lru_cache(maxsize=256)
+def _decode_escape_sequence(sequence: str) -> str:
+    """Cached implementation of ANSIDecoder.decode_escape_sequence.
+
+    Terminal output repeats a handful of sequences many times, so each distinct
+    sequence is matched against the table only once.
+    """
+    # Literal table entries are a dict lookup; only parametric ones need a regex
+    description = _EXACT_SEQUENCES.get(sequence)
+    if description is not None:
+        return description
+    for pattern, description in _PARAMETRIC_SEQUENCES:
+        if pattern.match(sequence):
+            return description
+
+    # Handle specific bracketed paste mode sequences
+    if "?2004h" in sequence:
+        return "Enable bracketed paste mode"
+    elif "?2004l" in sequence:
+        return "Disable bracketed paste mode"
+
+    # Handle generic patterns
+    if sequence.startswith("\x1b["):
+        if "?" in sequence:
+            if sequence.endswith("h"):
+                return f"Enable terminal mode ({sequence})"
+            elif sequence.endswith("l"):
+                return f"Disable terminal mode ({sequence})"
+        elif sequence.endswith("m"):
+            return f"Text formatting ({sequence})"
+        elif any(c in sequence for c in "ABCD"):
+            return f"Cursor movement ({sequence})"
+        elif "H" in sequence or "f" in sequence:
+            return f"Cursor positioning ({sequence})"
+        elif "J" in sequence or "K" in sequence:
+            return f"Clear operation ({sequence})"
+
+    return f"Unknown escape sequence ({sequence})"
+
+
+_EXACT_SEQUENCES, _PARAMETRIC_SEQUENCES = _split_escape_sequences(ANSIDecoder.ESCAPE_SEQUENCES)
+
+
+@functools.lru_cache(maxsize=256)
+def _sequence_label(sequence: str) -> str:
+    """Return the cached "repr (description)" label used as a sequence stats key."""
+    return f"{sequence!r} ({_decode_escape_sequence(sequence)})"
@@ -7,7 +7,7 @@ import os
 import signal
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Coroutine
 from typing import Any
 
 from ..config.constants import FORCE_EXIT_DELAY_SECONDS
@@ -34,7 +34,7 @@ class CleanupManager:
 
     def signal_handler(self, signum: int, _frame: Any) -> None:
         """Handle shutdown signals."""
-        logger.info(f"Received signal {signum}, forcing exit in {FORCE_EXIT_DELAY_SECONDS} seconds...")
+        logger.info("Received signal %s, forcing exit in %s seconds...", signum, FORCE_EXIT_DELAY_SECONDS)
 
         def force_exit() -> None:
             time.sleep(FORCE_EXIT_DELAY_SECONDS)
@@ -50,22 +50,20 @@ class CleanupManager:
         logger.info("Executing atexit cleanup...")
         self._shutdown_initiated = True
 
-        # Run sync handlers
-        for handler in self._cleanup_handlers:
-            try:
-                handler()
-            except Exception as e:
-                logger.error(f"Error in sync cleanup handler: {e}")
+        errors = self._run_sync_handlers()
 
-        # Run async handlers
-        if self._async_cleanup_handlers:
+        # Run async handlers; plain callables run inline, and a loop is only
+        # spun up (and torn down by asyncio.run) when a coroutine is pending
+        pending = self._start_async_handlers(errors)
+        if pending:
             try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(self._run_async_handlers())
-                loop.close()
+                errors.extend(asyncio.run(self._await_async_handlers(pending)))
             except Exception as e:
-                logger.error(f"Error in async cleanup: {e}")
+                errors.append(e)
+                for coro in pending:
+                    coro.close()
+
+        self._log_errors(errors)
 
     async def async_cleanup(self) -> None:
         """Asynchronous cleanup."""
@@ -75,25 +73,46 @@ class CleanupManager:
         self._shutdown_initiated = True
         logger.info("Initiating graceful shutdown...")
 
-        # Run sync handlers
+        errors = self._run_sync_handlers()
+        errors.extend(await self._await_async_handlers(self._start_async_handlers(errors)))
+        self._log_errors(errors)
+
+    def _run_sync_handlers(self) -> list[Exception]:
+        """Run every sync cleanup handler in order, returning the errors raised."""
+        errors: list[Exception] = []
         for handler in self._cleanup_handlers:
             try:
                 handler()
             except Exception as e:
-                logger.error(f"Error in sync cleanup handler: {e}")
+                errors.append(e)
+        return errors
 
-        # Run async handlers
-        await self._run_async_handlers()
+    def _start_async_handlers(self, errors: list[Exception]) -> list[Coroutine[Any, Any, Any]]:
+        """Call each async cleanup handler once, returning the coroutines left to await.
 
-    async def _run_async_handlers(self) -> None:
-        """Run all async cleanup handlers."""
+        Errors raised by the calls themselves are appended to errors.
+        """
+        pending: list[Coroutine[Any, Any, Any]] = []
         for handler in self._async_cleanup_handlers:
             try:
                 result = handler()
-                if asyncio.iscoroutine(result):
-                    await result
             except Exception as e:
-                logger.error(f"Error in async cleanup handler: {e}")
+                errors.append(e)
+                continue
+            if asyncio.iscoroutine(result):
+                pending.append(result)
+        return pending
+
+    async def _await_async_handlers(self, pending: list[Coroutine[Any, Any, Any]]) -> list[Exception]:
+        """Await coroutines returned by async cleanup handlers concurrently, returning their errors."""
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        return [result for result in results if isinstance(result, Exception)]
+
+    @staticmethod
+    def _log_errors(errors: list[Exception]) -> None:
+        """Report every cleanup failure in a single log record."""
+        if errors:
+            logger.error("%d cleanup handler(s) failed: %r", len(errors), errors)
 
     def setup_signal_handlers(self) -> None:
         """Setup signal handlers for graceful shutdown."""
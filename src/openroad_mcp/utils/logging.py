@@ -1,7 +1,7 @@
 """Logging configuration utilities."""
 
 import logging
-import sys
+import logging.config
 
 from ..config.settings import settings
 
@@ -14,14 +14,20 @@ def setup_logging(level: str | None = None, format_string: str | None = None) ->
     # Convert string level to logging constant
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
 
-    # Configure root logger
-    logging.basicConfig(
-        level=numeric_level, format=log_format, handlers=[logging.StreamHandler(sys.stderr)], force=True
+    # Apply the root handler and package logger level in one reconfiguration
+    logging.config.dictConfig(
+        {
+            "version": 1,
+            "disable_existing_loggers": False,
+            "formatters": {"default": {"format": log_format}},
+            "handlers": {
+                "stderr": {"class": "logging.StreamHandler", "stream": "ext://sys.stderr", "formatter": "default"}
+            },
+            "loggers": {"openroad_mcp": {"level": numeric_level}},
+            "root": {"level": numeric_level, "handlers": ["stderr"]},
+        }
     )
 
-    # Set specific logger levels
-    logging.getLogger("openroad_mcp").setLevel(numeric_level)
-
 
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance with the given name."""
@@ -1,9 +1,26 @@
 """Path security validation utilities to prevent directory traversal attacks."""
 
+import functools
+import os
+import re
+import time
 from pathlib import Path
 
+from ..config.constants import VALIDATION_CACHE_TTL_SECONDS
 from ..core.exceptions import ValidationError
 
+# Characters rejected in a path segment, mapped to the reason reported for them
+_FORBIDDEN_SEGMENT_CHARS = {
+    "/": "path separators",
+    "\\": "path separators",
+    "\x00": "null bytes",
+    "*": "glob characters (* ? [ ])",
+    "?": "glob characters (* ? [ ])",
+    "[": "glob characters (* ? [ ])",
+    "]": "glob characters (* ? [ ])",
+}
+_FORBIDDEN_SEGMENT_CHARS_RE = re.compile(r"[/\\\x00*?\[\]]")
+
 
 def validate_path_segment(segment: str, segment_name: str) -> None:
     """Validate a path segment to prevent directory traversal attacks.
@@ -17,29 +34,38 @@ def validate_path_segment(segment: str, segment_name: str) -> None:
     if segment in (".", ".."):
         raise ValidationError(f"{segment_name} cannot be '.' or '..'")
 
-    if "/" in segment or "\\" in segment:
-        raise ValidationError(f"{segment_name} cannot contain path separators")
+    match = _FORBIDDEN_SEGMENT_CHARS_RE.search(segment)
+    if match:
+        raise ValidationError(f"{segment_name} cannot contain {_FORBIDDEN_SEGMENT_CHARS[match.group()]}")
+
 
-    if "\x00" in segment:
-        raise ValidationError(f"{segment_name} cannot contain null bytes")
+@functools.lru_cache(maxsize=64)
+def _resolved_base(base_path: str, epoch: int) -> str:
+    """Return the resolved form of an absolute base directory.
 
-    if any(char in segment for char in "*?[]"):
-        raise ValidationError(f"{segment_name} cannot contain glob characters (* ? [ ])")
+    Base directories are shared by many validations, so their resolution is
+    cached; epoch only keys the cache and rolls over every
+    VALIDATION_CACHE_TTL_SECONDS. Callers pass an absolute path so the key
+    does not depend on the working directory. The base is trusted for up to
+    one TTL window: a symlink on it re-pointed within that window keeps
+    resolving to its old target until the epoch changes. Targets are always
+    resolved fresh.
+    """
+    return str(Path(base_path).resolve())
 
 
 def validate_safe_path_containment(target_path: Path, base_path: Path, context: str) -> None:
     """Validate that resolved target path is safely contained within base path.
 
     Uses Path.resolve() to handle symlinks and relative paths, then verifies
-    the resolved target is a child of the base path using relative_to().
+    the resolved target is the base path or lies underneath it.
     """
+    epoch = int(time.monotonic() // VALIDATION_CACHE_TTL_SECONDS)
     try:
-        resolved_target = target_path.resolve()
-        resolved_base = base_path.resolve()
+        resolved_target = str(target_path.resolve())
+        resolved_base = _resolved_base(os.path.abspath(base_path), epoch)
     except (OSError, RuntimeError) as e:
         raise ValidationError(f"Failed to resolve {context} path: {e}") from e
 
-    try:
-        resolved_target.relative_to(resolved_base)
-    except ValueError as e:
-        raise ValidationError(f"{context} path {target_path} is not contained within {base_path}") from e
+    if resolved_target != resolved_base and not resolved_target.startswith(resolved_base.rstrip(os.sep) + os.sep):
+        raise ValidationError(f"{context} path {target_path} is not contained within {base_path}")
@@ -7,7 +7,10 @@ import pytest
 from openroad_mcp.config.cli import create_argument_parser
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def argument_parser() -> ArgumentParser:
-    """Create a CLI argument parser for testing."""
+    """Create a CLI argument parser shared by all CLI tests.
+
+    Parsing never mutates the parser, so building it once is safe.
+    """
     return create_argument_parser()
@@ -6,6 +6,13 @@ import pytest
 
 from openroad_mcp.config.cli import CLIConfig, TransportConfig, parse_cli_args
 
+# Shared argv vectors; tuples so no test can mutate another's input
+_ARGV_HTTP_HOST_PORT = ("--transport", "http", "--host", "example.com", "--port", "9000")
+_ARGV_STDIO_HOST = ("--transport", "stdio", "--host", "example.com")
+_ARGV_STDIO_PORT = ("--transport", "stdio", "--port", "9000")
+_ARGV_STDIO_HOST_PORT = ("--transport", "stdio", "--host", "example.com", "--port", "9000")
+_ARGV_STDIO_OTHER_HOST = ("--transport", "stdio", "--host", "custom.com")
+
 
 class TestArgumentParsing:
     """Test basic argument parsing behavior."""
@@ -22,7 +29,7 @@ class TestArgumentParsing:
 
     def test_custom_host_and_port(self, argument_parser: ArgumentParser) -> None:
         """Test custom host and port values."""
-        args = argument_parser.parse_args(["--transport", "http", "--host", "example.com", "--port", "9000"])
+        args = argument_parser.parse_args(list(_ARGV_HTTP_HOST_PORT))
 
         assert args.host == "example.com"
         assert args.port == 9000
@@ -32,16 +39,18 @@ class TestArgumentParsing:
         args = argument_parser.parse_args(["--verbose"])
         assert args.verbose is True
 
-    def test_log_level_options(self, argument_parser: ArgumentParser) -> None:
+    @pytest.mark.parametrize("level", ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
+    def test_log_level_options(self, argument_parser: ArgumentParser, level: str) -> None:
         """Test various log level settings."""
-        for level in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
-            args = argument_parser.parse_args(["--log-level", level])
-            assert args.log_level == level
+        args = argument_parser.parse_args(["--log-level", level])
+        assert args.log_level == level
 
-    def test_invalid_transport_mode(self, argument_parser: ArgumentParser) -> None:
-        """Test invalid transport mode raises SystemExit."""
+    @pytest.mark.parametrize("via_parse_cli_args", [False, True], ids=["parser", "parse_cli_args"])
+    def test_invalid_transport_mode(self, argument_parser: ArgumentParser, via_parse_cli_args: bool) -> None:
+        """Test invalid transport mode raises SystemExit from the parser and parse_cli_args."""
+        parse = parse_cli_args if via_parse_cli_args else argument_parser.parse_args
         with pytest.raises(SystemExit):
-            argument_parser.parse_args(["--transport", "invalid"])
+            parse(["--transport", "invalid"])
 
     def test_invalid_log_level(self, argument_parser: ArgumentParser) -> None:
         """Test invalid log level raises SystemExit."""
@@ -59,34 +68,21 @@ class TestValidation:
 
     def test_http_options_allowed_with_http_transport(self) -> None:
         """HTTP options should work with http transport."""
-        config = parse_cli_args(["--transport", "http", "--host", "example.com", "--port", "9000"])
+        config = parse_cli_args(list(_ARGV_HTTP_HOST_PORT))
 
         assert config.transport.mode == "http"
         assert config.transport.host == "example.com"
         assert config.transport.port == 9000
 
-    def test_custom_host_with_stdio_raises_error(self) -> None:
-        """Custom host with stdio transport should raise error."""
-        with pytest.raises(SystemExit):
-            parse_cli_args(["--transport", "stdio", "--host", "example.com"])
-
-    def test_custom_port_with_stdio_raises_error(self) -> None:
-        """Custom port with stdio transport should raise error."""
-        with pytest.raises(SystemExit):
-            parse_cli_args(["--transport", "stdio", "--port", "9000"])
-
-    def test_both_host_and_port_with_stdio_raises_error(self) -> None:
-        """Both custom host and port with stdio should raise error."""
+    @pytest.mark.parametrize(
+        "argv",
+        [_ARGV_STDIO_HOST, _ARGV_STDIO_PORT, _ARGV_STDIO_HOST_PORT, _ARGV_STDIO_OTHER_HOST],
+        ids=["host", "port", "host-and-port", "other-host"],
+    )
+    def test_http_options_with_stdio_raise_error(self, argv: tuple[str, ...]) -> None:
+        """Custom HTTP host or port with stdio transport should raise error."""
         with pytest.raises(SystemExit):
-            parse_cli_args(["--transport", "stdio", "--host", "example.com", "--port", "9000"])
-
-    def test_mixed_custom_and_default_values_with_stdio_raises_error(self) -> None:
-        """Mixed custom and default HTTP values with stdio should raise error."""
-        with pytest.raises(SystemExit):
-            parse_cli_args(["--transport", "stdio", "--host", "custom.com"])
-
-        with pytest.raises(SystemExit):
-            parse_cli_args(["--transport", "stdio", "--port", "9000"])
+            parse_cli_args(list(argv))
 
 
 class TestConfigurationCreation:
@@ -104,13 +100,6 @@ class TestConfigurationCreation:
         assert config.verbose is True
         assert config.log_level == "DEBUG"
 
-    def test_config_from_args_validation_error(self) -> None:
-        """Test that invalid configuration raises ValueError."""
-        # This would typically test Pydantic validation, but our current
-        # models are simple. We'll test the error handling path.
-        with pytest.raises((SystemExit, ValueError)):
-            parse_cli_args(["--transport", "invalid-mode"])
-
 
 class TestErrorHandling:
     """Test error scenarios and help functionality."""
@@ -5,28 +5,50 @@ from collections.abc import AsyncGenerator
 
 import pytest
 import pytest_asyncio
+from fastmcp import Client
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+from openroad_mcp.server import mcp
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an event loop for the test session."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+SERVER_PARAMS = StdioServerParameters(command="python", args=["-m", "openroad_mcp.main"], env=None)
+READY_TIMEOUT_SECONDS = 5.0
+READY_POLL_INTERVAL_SECONDS = 0.05
 
 
-@pytest_asyncio.fixture(scope="function")
+async def _wait_until_ready(session: ClientSession) -> None:
+    """Poll the server with list_tools until it answers or the deadline passes."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + READY_TIMEOUT_SECONDS
+    while True:
+        try:
+            await session.list_tools()
+            return
+        except Exception:
+            if loop.time() >= deadline:
+                raise
+            await asyncio.sleep(READY_POLL_INTERVAL_SECONDS)
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Run tests that share the session-scoped MCP client on the session event loop."""
+    for item in items:
+        if "mcp_client" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.asyncio(loop_scope="session"), append=False)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def mcp_client() -> AsyncGenerator[ClientSession]:
-    """Fixture providing a MCP client session."""
-    server_params = StdioServerParameters(command="python", args=["-m", "openroad_mcp.main"], env=None)
+    """Fixture providing a MCP client session shared by the whole test session.
 
+    Starting the server subprocess dominates integration test time, so one
+    server is reused; tests that need a fresh process should start their own.
+    """
     try:
-        async with stdio_client(server_params) as (read, write):
+        async with stdio_client(SERVER_PARAMS) as (read, write):
             async with ClientSession(read, write) as session:
                 await session.initialize()
-                await asyncio.sleep(1.0)
+                await _wait_until_ready(session)
                 yield session
     except RuntimeError as e:
         if "cancel scope" in str(e):
@@ -34,3 +56,14 @@ async def mcp_client() -> AsyncGenerator[ClientSession]:
             pass
         else:
             raise
+
+
+@pytest_asyncio.fixture
+async def inprocess_mcp_client() -> AsyncGenerator[ClientSession]:
+    """Fixture providing a MCP client session wired to the server in this process.
+
+    Messages travel over in-memory streams instead of a stdio subprocess, so
+    tests that only exercise tool plumbing skip interpreter startup entirely.
+    """
+    async with Client(mcp) as client:
+        yield client.session
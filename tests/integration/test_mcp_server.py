@@ -0,0 +1,58 @@
+"""Integration tests for the MCP tool surface over in-process and stdio clients."""
+
+import json
+
+import pytest
+from mcp.types import TextContent
+
+
+@pytest.mark.asyncio
+class TestMCPServerInProcess:
+    """Exercise tool registration and dispatch without spawning a server process."""
+
+    async def test_registered_tools(self, inprocess_mcp_client):
+        """Test every public tool is advertised to clients."""
+        result = await inprocess_mcp_client.list_tools()
+
+        names = {tool.name for tool in result.tools}
+        assert {
+            "interactive_openroad_query",
+            "interactive_openroad_exec",
+            "list_interactive_sessions",
+            "create_interactive_session",
+            "terminate_interactive_session",
+            "inspect_interactive_session",
+            "get_session_history",
+            "get_session_metrics",
+            "list_report_images",
+            "read_report_image",
+            "read_report_images",
+        } <= names
+
+    async def test_list_sessions_round_trip(self, inprocess_mcp_client):
+        """Test a tool call is dispatched and its JSON result returned as text."""
+        response = await inprocess_mcp_client.call_tool("list_interactive_sessions", {})
+
+        assert not response.isError
+        content = response.content[0]
+        assert isinstance(content, TextContent)
+        assert "sessions" in json.loads(content.text)
+
+
+class TestMCPServerStdio:
+    """Exercise the real server entry point over stdio, sharing one subprocess."""
+
+    async def test_server_starts_and_lists_tools(self, mcp_client):
+        """Test the server subprocess starts and advertises its tools."""
+        result = await mcp_client.list_tools()
+
+        assert "list_interactive_sessions" in {tool.name for tool in result.tools}
+
+    async def test_list_sessions_round_trip(self, mcp_client):
+        """Test a tool call over stdio reuses the same server subprocess."""
+        response = await mcp_client.call_tool("list_interactive_sessions", {})
+
+        assert not response.isError
+        content = response.content[0]
+        assert isinstance(content, TextContent)
+        assert "sessions" in json.loads(content.text)
@@ -1,7 +1,9 @@
 """Integration tests for PTY functionality using real processes."""
 
 import asyncio
+import codecs
 import os
+import pty
 import sys
 from unittest.mock import patch
 
@@ -102,20 +104,36 @@ class _MacOSPTYHandler(PTYHandler):
         await super().cleanup()
 
 
-def can_create_pty() -> bool:
-    """Check if PTY creation is supported in current environment."""
-    try:
-        import pty
+# Probe once whether PTY creation is supported in the current environment
+try:
+    _master_fd, _slave_fd = pty.openpty()
+    os.close(_master_fd)
+    os.close(_slave_fd)
+    _HAS_PTY = True
+except OSError:
+    _HAS_PTY = False
 
-        master_fd, slave_fd = pty.openpty()
-        os.close(master_fd)
-        os.close(slave_fd)
-        return True
-    except (OSError, ImportError):
-        return False
+skip_if_no_pty = pytest.mark.skipif(not _HAS_PTY, reason="PTY not supported in current environment")
 
 
-skip_if_no_pty = pytest.mark.skipif(not can_create_pty(), reason="PTY not supported in current environment")
+async def _drain_until_exit(handler: PTYHandler) -> str:
+    """Collect PTY output as it is produced until the process exits and the master is empty.
+
+    Chunks are decoded as they arrive, so a multi-byte character split across
+    reads is still decoded correctly and nothing is re-decoded at the end.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    parts: list[str] = []
+    while handler.is_process_alive():
+        output = await handler.read_output()
+        if output:
+            parts.append(decoder.decode(output))
+        else:
+            await asyncio.sleep(0.01)
+    while output := await handler.read_output():
+        parts.append(decoder.decode(output))
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)
 
 
 @pytest.mark.asyncio
@@ -182,7 +200,7 @@ class TestPTYIntegration:
     @skip_if_no_pty
     async def test_multi_line_output(self, pty_handler):
         """Test handling of multi-line command output."""
-        cmd = ["bash", "-c", "echo line1; echo line2; echo line3"]
+        cmd = ["printf", "%s\n", "line1", "line2", "line3"]
         await pty_handler.create_session(cmd)
 
         assert pty_handler.is_process_alive()
@@ -232,33 +250,39 @@ class TestPTYIntegration:
 
         assert pty_handler.is_process_alive()
 
+        done = asyncio.Event()
+
         # Define concurrent operations
         async def write_data():
             for i in range(3):
                 await pty_handler.write_input(f"line {i}\n".encode())
                 await asyncio.sleep(0.1)
             await pty_handler.terminate_process()
+            done.set()
 
         async def read_data():
-            collected_output = b""
-            for _ in range(10):  # Try reading multiple times
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+            parts: list[str] = []
+            while not done.is_set():
                 output = await pty_handler.read_output()
                 if output:
-                    collected_output += output
-                await asyncio.sleep(0.1)
-                if not pty_handler.is_process_alive():
-                    break
-            return collected_output
+                    parts.append(decoder.decode(output))
+                else:
+                    await asyncio.sleep(0.01)
+            # Drain anything echoed just before the writer finished
+            while output := await pty_handler.read_output():
+                parts.append(decoder.decode(output))
+            parts.append(decoder.decode(b"", final=True))
+            return "".join(parts)
 
-        # Run operations concurrently
-        write_task = asyncio.create_task(write_data())
-        read_task = asyncio.create_task(read_data())
+        # Run operations concurrently; a failure on either side cancels the other
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(write_data())
+            read_task = tg.create_task(read_data())
 
-        await write_task
-        output = await read_task
+        output_str = read_task.result()
 
         # Verify we got expected output
-        output_str = output.decode("utf-8", errors="ignore")
         assert "line 0" in output_str
         assert "line 1" in output_str
         assert "line 2" in output_str
@@ -294,32 +318,22 @@ class TestPTYIntegration:
     @skip_if_no_pty
     async def test_large_output_handling(self, pty_handler):
         """Test handling of large output."""
-        # Generate large output with proper variable expansion
-        cmd = [
-            "bash",
-            "-c",
-            'for i in {1..100}; do echo "This is line $i with some extra text to make it longer"; done',
-        ]
-        await pty_handler.create_session(cmd)
+        # Build the output up front so a single printf emits it without a shell loop
+        payload = "\n".join(f"This is line {i} with some extra text to make it longer" for i in range(1, 101))
+        await pty_handler.create_session(["printf", "%s\n", payload])
 
         assert pty_handler.is_process_alive()
 
+        # Drain while the process runs so it never blocks on a full PTY buffer
+        reader = asyncio.create_task(_drain_until_exit(pty_handler))
+
         # Wait for completion
         exit_code = await pty_handler.wait_for_exit(timeout=5.0)
         assert exit_code == 0
-
-        # Read output in chunks
-        collected_output = b""
-        while True:
-            output = await pty_handler.read_output()
-            if output:
-                collected_output += output
-            else:
-                break
+        output_str = await reader
 
         # Verify we got substantial output
-        assert len(collected_output) > 1000
-        output_str = collected_output.decode("utf-8", errors="ignore")
+        assert len(output_str) > 1000
         assert "line 1" in output_str
         assert "line 100" in output_str
 
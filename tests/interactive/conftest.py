@@ -1,6 +1,5 @@
 """Configuration for interactive tests."""
 
-import gc
 import warnings
 
 import pytest
@@ -23,7 +22,8 @@ async def reset_manager():
     yield
 
     # Tear down: clean up any sessions the test left open.
-    # cleanup_all() terminates all session background tasks (reader/writer/exit-monitor).
+    # cleanup_all() terminates all session background tasks (reader/writer/exit-monitor)
+    # and closes each PTY's file descriptors, so no garbage-collection pass is needed.
     # Blanket asyncio.all_tasks() cancellation is intentionally avoided: it would kill
     # pytest-asyncio / anyio internal housekeeping and hide real task-leak bugs.
     instance = OpenROADManager._instance
@@ -34,18 +34,8 @@ async def reset_manager():
             warnings.warn(f"reset_manager teardown: cleanup_all() failed: {e}", stacklevel=2)
         OpenROADManager._instance = None
 
-    gc.collect()
-
 
 # Configure pytest to run interactive tests with shorter timeouts
 def pytest_configure(config):
     """Configure pytest for interactive tests."""
     config.addinivalue_line("markers", "slow: mark test as slow running")
-
-
-def pytest_collection_modifyitems(config, items):
-    """Modify test collection to add appropriate markers."""
-    for item in items:
-        # Mark PTY and session tests as potentially slow
-        if "pty" in item.name.lower() or "session" in item.name.lower():
-            item.add_marker(pytest.mark.slow)
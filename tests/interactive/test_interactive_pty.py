@@ -1,14 +1,50 @@
 """Tests for PTYHandler implementation."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import os
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from unittest.mock import ANY, AsyncMock, Mock, patch
 
 import pytest
 
 from openroad_mcp.interactive.models import PTYError
 from openroad_mcp.interactive.pty_handler import PTYHandler
 
+PTY_MODULE = "openroad_mcp.interactive.pty_handler"
+
+
+@dataclass(eq=False)
+class FakeProcess:
+    """Lightweight stand-in for asyncio.subprocess.Process whose wait() completes immediately."""
+
+    pid: int = 12345
+    returncode: int | None = None
+    terminate: Mock = field(default_factory=Mock)
+    kill: Mock = field(default_factory=Mock)
+    wait: AsyncMock = field(default_factory=lambda: AsyncMock(return_value=None))
+
+
+@pytest.fixture
+def pty_mocks():
+    """Patch the OS-level calls PTYHandler.create_session makes, with PTY-like defaults."""
+    with ExitStack() as stack:
+        mocks = SimpleNamespace(
+            openpty=stack.enter_context(patch(f"{PTY_MODULE}.pty.openpty", return_value=(10, 11))),
+            tcgetattr=stack.enter_context(patch(f"{PTY_MODULE}.termios.tcgetattr", return_value=[0, 0, 0, 0, 0, 0])),
+            tcsetattr=stack.enter_context(patch(f"{PTY_MODULE}.termios.tcsetattr")),
+            fcntl=stack.enter_context(patch(f"{PTY_MODULE}.fcntl.fcntl", return_value=0)),
+            subprocess=stack.enter_context(
+                patch(f"{PTY_MODULE}.asyncio.create_subprocess_exec", new_callable=AsyncMock)
+            ),
+            close=stack.enter_context(patch(f"{PTY_MODULE}.os.close")),
+            write=stack.enter_context(patch(f"{PTY_MODULE}.os.write")),
+        )
+        yield mocks
+
 
 @pytest.mark.asyncio
+@pytest.mark.slow
 class TestPTYHandler:
     """Test suite for PTYHandler."""
 
@@ -36,59 +72,34 @@ class TestPTYHandler:
         assert pty_handler.process is None
         assert pty_handler._original_attrs is None
 
-    @patch("openroad_mcp.interactive.pty_handler.pty.openpty")
-    @patch("openroad_mcp.interactive.pty_handler.termios.tcgetattr")
-    @patch("openroad_mcp.interactive.pty_handler.termios.tcsetattr")
-    @patch("openroad_mcp.interactive.pty_handler.fcntl.fcntl")
-    @patch("openroad_mcp.interactive.pty_handler.asyncio.create_subprocess_exec", new_callable=AsyncMock)
-    @patch("openroad_mcp.interactive.pty_handler.os.close")
-    async def test_create_session_success(
-        self,
-        mock_os_close,
-        mock_subprocess,
-        mock_fcntl,
-        mock_tcsetattr,
-        mock_tcgetattr,
-        mock_openpty,
-        pty_handler,
-        tmp_path,
-    ):
+    async def test_create_session_success(self, tmp_path, pty_handler, pty_mocks):
         """Test successful PTY session creation."""
-        # Setup mocks
-        mock_openpty.return_value = (10, 11)  # master_fd, slave_fd
-        mock_tcgetattr.return_value = [0, 0, 0, 0, 0, 0]  # Mock termios attrs
-        mock_fcntl.return_value = 0
-
-        mock_process = MagicMock()
-        mock_process.pid = 12345
-        mock_subprocess.return_value = mock_process
+        mock_process = FakeProcess()
+        pty_mocks.subprocess.return_value = mock_process
 
         # Create session
         await pty_handler.create_session(["echo", "hello"], env={"TEST": "value"}, cwd=str(tmp_path))
 
         # Verify PTY creation
-        mock_openpty.assert_called_once()
+        pty_mocks.openpty.assert_called_once()
         assert pty_handler.master_fd == 10
         assert pty_handler.slave_fd is None  # Should be closed in parent
 
         # Verify slave FD was closed
-        mock_os_close.assert_called_once_with(11)
+        pty_mocks.close.assert_called_once_with(11)
 
         # Verify terminal configuration
-        mock_tcgetattr.assert_called_with(11)
-        mock_tcsetattr.assert_called()
-        mock_fcntl.assert_called()
+        pty_mocks.tcgetattr.assert_called_with(11)
+        pty_mocks.tcsetattr.assert_called()
+        pty_mocks.fcntl.assert_called()
 
         # Verify process creation
-        mock_subprocess.assert_called_once()
-        call_args = mock_subprocess.call_args
-        assert call_args[0] == ("echo", "hello")  # Command args
-        assert call_args[1]["stdin"] == 11
-        assert call_args[1]["stdout"] == 11
-        assert call_args[1]["stderr"] == 11
-        assert call_args[1]["cwd"] == str(tmp_path)
-        assert "TEST" in call_args[1]["env"]
-        assert "TERM" in call_args[1]["env"]
+        pty_mocks.subprocess.assert_awaited_once_with(
+            "echo", "hello", stdin=11, stdout=11, stderr=11, env=ANY, cwd=str(tmp_path), preexec_fn=os.setsid
+        )
+        env = pty_mocks.subprocess.await_args.kwargs["env"]
+        assert "TEST" in env
+        assert "TERM" in env
 
         assert pty_handler.process == mock_process
 
@@ -179,8 +190,7 @@ class TestPTYHandler:
 
     async def test_is_process_alive_with_process(self, pty_handler):
         """Test is_process_alive with mock process."""
-        mock_process = MagicMock()
-        mock_process.returncode = None  # Still running
+        mock_process = FakeProcess()  # Still running
         pty_handler.process = mock_process
 
         assert pty_handler.is_process_alive()
@@ -196,9 +206,7 @@ class TestPTYHandler:
     async def test_wait_for_exit_with_timeout(self, pty_handler):
         """Test waiting for exit with timeout."""
 
-        mock_process = MagicMock()
-        mock_process.wait = AsyncMock()
-        pty_handler.process = mock_process
+        pty_handler.process = FakeProcess()
 
         with patch("asyncio.wait_for", new_callable=AsyncMock, side_effect=TimeoutError()):
             result = await pty_handler.wait_for_exit(timeout=0.01)
@@ -206,10 +214,7 @@ class TestPTYHandler:
 
     async def test_wait_for_exit_success(self, pty_handler):
         """Test successful wait for exit."""
-        mock_process = MagicMock()
-        mock_process.wait = AsyncMock(return_value=None)
-        mock_process.returncode = 0
-        pty_handler.process = mock_process
+        pty_handler.process = FakeProcess(returncode=0)
 
         result = await pty_handler.wait_for_exit()
         assert result == 0
@@ -221,19 +226,17 @@ class TestPTYHandler:
 
     async def test_terminate_process_already_dead(self, pty_handler):
         """Test terminating already dead process."""
-        mock_process = MagicMock()
-        mock_process.returncode = 0  # Already exited
+        mock_process = FakeProcess(returncode=0)  # Already exited
         pty_handler.process = mock_process
 
         await pty_handler.terminate_process()
-        # Should not call terminate on dead process
+
+        mock_process.terminate.assert_not_called()
 
     @patch("openroad_mcp.interactive.pty_handler.os.close")
     async def test_terminate_process_graceful(self, _mock_close, pty_handler):
         """Test graceful process termination."""
-        mock_process = MagicMock()
-        mock_process.returncode = None  # Still running
-        mock_process.wait = AsyncMock(return_value=None)
+        mock_process = FakeProcess()  # Still running
         pty_handler.process = mock_process
 
         await pty_handler.terminate_process(force=False)
@@ -245,9 +248,7 @@ class TestPTYHandler:
     @patch("openroad_mcp.interactive.pty_handler.os.close")
     async def test_terminate_process_force_after_timeout(self, _mock_close, mock_wait_for, pty_handler):
         """Test forced termination after graceful timeout."""
-        mock_process = MagicMock()
-        mock_process.returncode = None
-        mock_process.wait = AsyncMock(return_value=None)
+        mock_process = FakeProcess()
         # First call to wait_for times out, second call succeeds
         mock_wait_for.side_effect = [TimeoutError(), None]
         pty_handler.process = mock_process
@@ -260,8 +261,7 @@ class TestPTYHandler:
     @patch("openroad_mcp.interactive.pty_handler.os.close")
     async def test_terminate_process_force_immediate(self, _mock_close, pty_handler):
         """Test immediate forced termination."""
-        mock_process = MagicMock()
-        mock_process.returncode = None
+        mock_process = FakeProcess()
         pty_handler.process = mock_process
 
         await pty_handler.terminate_process(force=True)
@@ -274,10 +274,7 @@ class TestPTYHandler:
     async def test_cleanup_success(self, mock_close, mock_tcsetattr, pty_handler):
         """Test successful cleanup."""
         # Setup handler state
-        mock_process = MagicMock()
-        mock_process.returncode = None
-        mock_process.terminate = MagicMock()
-        mock_process.wait = AsyncMock(return_value=None)
+        mock_process = FakeProcess()
         pty_handler.process = mock_process
         pty_handler.master_fd = 10
         pty_handler.slave_fd = 11
@@ -333,34 +330,19 @@ class TestPTYHandler:
 
 
 @pytest.mark.asyncio
+@pytest.mark.slow
 class TestPTYHandlerAsync:
     """Async test runner for PTYHandler."""
 
-    async def test_pty_handler_lifecycle(self):
+    async def test_pty_handler_lifecycle(self, pty_mocks):
         """Test complete PTY handler lifecycle."""
         from openroad_mcp.config.settings import settings
 
-        with (
-            patch.object(settings, "ENABLE_COMMAND_VALIDATION", False),
-            patch("openroad_mcp.interactive.pty_handler.pty.openpty") as mock_openpty,
-            patch("openroad_mcp.interactive.pty_handler.termios.tcgetattr") as mock_tcgetattr,
-            patch("openroad_mcp.interactive.pty_handler.termios.tcsetattr"),
-            patch("openroad_mcp.interactive.pty_handler.fcntl.fcntl"),
-            patch(
-                "openroad_mcp.interactive.pty_handler.asyncio.create_subprocess_exec", new_callable=AsyncMock
-            ) as mock_subprocess,
-            patch("openroad_mcp.interactive.pty_handler.os.close"),
-            patch("openroad_mcp.interactive.pty_handler.os.write") as mock_write,
-        ):
-            # Setup mocks
-            mock_openpty.return_value = (10, 11)
-            mock_tcgetattr.return_value = [0, 0, 0, 0, 0, 0]
-            mock_process = MagicMock()
-            mock_process.pid = 12345
-            mock_process.returncode = None
-            mock_subprocess.return_value = mock_process
-            mock_write.return_value = 6  # Return length of "hello\n"
+        mock_process = FakeProcess()
+        pty_mocks.subprocess.return_value = mock_process
+        pty_mocks.write.return_value = 6  # Return length of "hello\n"
 
+        with patch.object(settings, "ENABLE_COMMAND_VALIDATION", False):
             # Create handler inside mocked context
             handler = PTYHandler()
 
@@ -1,21 +1,36 @@
 """Tests for InteractiveSession implementation."""
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from openroad_mcp.core.models import SessionState
 from openroad_mcp.interactive.models import SessionTerminatedError
+from openroad_mcp.interactive.pty_handler import PTYHandler
 from openroad_mcp.interactive.session import InteractiveSession
 
 
+@pytest.fixture(autouse=True)
+def mock_pty(monkeypatch):
+    """Replace PTYHandler so every session in this module gets one pre-built mock PTY.
+
+    The spec makes only PTYHandler's coroutine methods awaitable mocks. Tests
+    that need different behaviour configure the returned mock directly.
+    """
+    mock = MagicMock(spec=PTYHandler)
+    mock.is_process_alive.return_value = True
+    monkeypatch.setattr("openroad_mcp.interactive.session.PTYHandler", lambda: mock)
+    return mock
+
+
 @pytest.mark.asyncio
+@pytest.mark.slow
 class TestInteractiveSession:
     """Test suite for InteractiveSession."""
 
     @pytest.fixture
-    def session(self):
+    def session(self, mock_pty):
         """Create a test session."""
         return InteractiveSession("test-session-1", buffer_size=1024)
 
@@ -42,15 +57,8 @@ class TestInteractiveSession:
         assert info.buffer_size == 0
         assert info.uptime_seconds is not None
 
-    @patch("openroad_mcp.interactive.session.PTYHandler")
-    async def test_session_start_success(self, mock_pty_class, session):
+    async def test_session_start_success(self, mock_pty, session):
         """Test successful session start."""
-        # Mock PTY handler
-        mock_pty = AsyncMock()
-        mock_pty.is_process_alive = MagicMock(return_value=True)
-        mock_pty_class.return_value = mock_pty
-        session.pty = mock_pty
-
         # Start session
         await session.start(["echo", "test"])
 
@@ -66,14 +74,10 @@ class TestInteractiveSession:
         # Cleanup
         await session.cleanup()
 
-    @patch("openroad_mcp.interactive.session.PTYHandler")
-    async def test_session_start_failure(self, mock_pty_class, session):
+    async def test_session_start_failure(self, mock_pty, session):
         """Test session start failure handling."""
         # Mock PTY handler to raise exception
-        mock_pty = AsyncMock()
         mock_pty.create_session.side_effect = Exception("PTY creation failed")
-        mock_pty_class.return_value = mock_pty
-        session.pty = mock_pty
 
         # Start session should fail
         with pytest.raises(Exception, match="Failed to start session"):
@@ -82,15 +86,8 @@ class TestInteractiveSession:
         # Verify error state
         assert session.state == SessionState.ERROR
 
-    @patch("openroad_mcp.interactive.session.PTYHandler")
-    async def test_send_command(self, mock_pty_class, session):
+    async def test_send_command(self, session):
         """Test sending commands to session."""
-        # Setup mock
-        from unittest.mock import MagicMock
-
-        mock_pty = MagicMock()
-        mock_pty.is_process_alive = MagicMock(return_value=True)
-        session.pty = mock_pty
         session.state = SessionState.ACTIVE
 
         # Send command
@@ -104,22 +101,22 @@ class TestInteractiveSession:
         queued_data = await session.input_queue.get()
         assert queued_data == b"test command\n"
 
-    async def test_send_command_to_dead_session(self, session):
-        """Test sending command to terminated session."""
+    @pytest.mark.parametrize(
+        "method, args",
+        [
+            pytest.param("send_command", ("test",), id="send_command"),
+            pytest.param("read_output", (), id="read_output"),
+        ],
+    )
+    async def test_io_on_dead_session(self, session, method, args):
+        """Test sending to or reading from a terminated session raises."""
         session.state = SessionState.TERMINATED
 
         with pytest.raises(SessionTerminatedError):
-            await session.send_command("test")
+            await getattr(session, method)(*args)
 
-    @patch("openroad_mcp.interactive.session.PTYHandler")
-    async def test_read_output_timeout(self, mock_pty_class, session):
+    async def test_read_output_timeout(self, session):
         """Test reading output with timeout."""
-        # Setup mock
-        from unittest.mock import MagicMock
-
-        mock_pty = MagicMock()
-        mock_pty.is_process_alive = MagicMock(return_value=True)
-        session.pty = mock_pty
         session.state = SessionState.ACTIVE
 
         # Add some test data to buffer
@@ -133,24 +130,8 @@ class TestInteractiveSession:
         assert result.command_count == 0
         assert result.execution_time >= 0
 
-    @patch("openroad_mcp.interactive.session.PTYHandler")
-    async def test_read_output_from_dead_session(self, mock_pty_class, session):
-        """Test reading from terminated session."""
-        session.state = SessionState.TERMINATED
-
-        with pytest.raises(SessionTerminatedError):
-            await session.read_output()
-
-    @patch("openroad_mcp.interactive.session.PTYHandler")
-    async def test_session_termination(self, mock_pty_class, session):
+    async def test_session_termination(self, mock_pty, session):
         """Test session termination."""
-        # Setup mock
-        from unittest.mock import MagicMock
-
-        mock_pty = MagicMock()
-        mock_pty.is_process_alive = MagicMock(return_value=True)
-        mock_pty.terminate_process = AsyncMock()
-        session.pty = mock_pty
         session.state = SessionState.ACTIVE
 
         # Create mock tasks - set to None so they're not considered active
@@ -165,16 +146,9 @@ class TestInteractiveSession:
         assert session.state == SessionState.TERMINATED
         mock_pty.terminate_process.assert_called_once_with(False)
 
-    @patch("openroad_mcp.interactive.session.PTYHandler")
-    async def test_session_cleanup(self, mock_pty_class, session):
+    async def test_session_cleanup(self, mock_pty, session):
         """Test session cleanup."""
-        # Setup mock
-        from unittest.mock import MagicMock
-
-        mock_pty = MagicMock()
-        mock_pty.cleanup = AsyncMock()
-        mock_pty.is_process_alive = MagicMock(return_value=False)
-        session.pty = mock_pty
+        mock_pty.is_process_alive.return_value = False
         session.state = SessionState.ACTIVE
 
         # Add some data to buffer
@@ -189,13 +163,8 @@ class TestInteractiveSession:
         mock_pty.cleanup.assert_called_once()
         assert await session.output_buffer.get_size() == 0
 
-    @patch("openroad_mcp.interactive.session.PTYHandler")
-    async def test_default_command(self, mock_pty_class, session):
+    async def test_default_command(self, mock_pty, session):
         """Test that default OpenROAD command is used when none specified."""
-        mock_pty = AsyncMock()
-        mock_pty.is_process_alive = MagicMock(return_value=True)
-        session.pty = mock_pty
-
         await session.start()
 
         # Verify default command was used
@@ -204,13 +173,8 @@ class TestInteractiveSession:
         # Cleanup
         await session.cleanup()
 
-    @patch("openroad_mcp.interactive.session.PTYHandler")
-    async def test_command_with_environment(self, mock_pty_class, session):
+    async def test_command_with_environment(self, mock_pty, session):
         """Test starting session with custom environment and working directory."""
-        mock_pty = AsyncMock()
-        mock_pty.is_process_alive = MagicMock(return_value=True)
-        session.pty = mock_pty
-
         env = {"TEST_VAR": "value"}
         cwd = "/test/dir"
 
@@ -222,28 +186,22 @@ class TestInteractiveSession:
         # Cleanup
         await session.cleanup()
 
-    async def test_is_alive_states(self, session):
+    @pytest.mark.parametrize(
+        "state, process_alive, expected, state_after",
+        [
+            pytest.param(SessionState.CREATING, True, False, SessionState.CREATING, id="creating"),
+            pytest.param(SessionState.ACTIVE, False, False, SessionState.TERMINATED, id="active-dead-process"),
+            pytest.param(SessionState.ACTIVE, True, True, SessionState.ACTIVE, id="active-live-process"),
+            pytest.param(SessionState.TERMINATED, True, False, SessionState.TERMINATED, id="terminated"),
+        ],
+    )
+    async def test_is_alive_states(self, mock_pty, session, state, process_alive, expected, state_after):
         """Test is_alive method in different states."""
-        # Creating state
-        assert not session.is_alive()
+        session.state = state
+        mock_pty.is_process_alive.return_value = process_alive
 
-        # Active state with dead process
-        session.state = SessionState.ACTIVE
-        with patch.object(session.pty, "is_process_alive", return_value=False):
-            assert not session.is_alive()
-            assert session.state == SessionState.TERMINATED
-
-        # Reset state for next test
-        session.state = SessionState.ACTIVE
-
-        # Active state with live process
-        with patch.object(session.pty, "is_process_alive", return_value=True):
-            assert session.is_alive()
-            assert session.state == SessionState.ACTIVE
-
-        # Terminated state
-        session.state = SessionState.TERMINATED
-        assert not session.is_alive()
+        assert session.is_alive() is expected
+        assert session.state == state_after
 
     async def test_command_count_increment(self, session):
         """Test that command count increments correctly."""
@@ -257,17 +215,13 @@ class TestInteractiveSession:
             await session.send_command("cmd2")
             assert session.command_count == initial_count + 2
 
-    @patch("openroad_mcp.interactive.session.PTYHandler")
-    async def test_output_collection_timing(self, mock_pty_class, session):
+    async def test_output_collection_timing(self, session):
         """Test output collection with proper timing."""
-        mock_pty = AsyncMock()
-        mock_pty.is_process_alive = MagicMock(return_value=True)
-        session.pty = mock_pty
         session.state = SessionState.ACTIVE
 
-        # Simulate delayed output arrival
+        # Simulate output arriving after the reader is already waiting: the task
+        # first runs once read_output blocks on the empty buffer
         async def delayed_output():
-            await asyncio.sleep(0.05)  # 50ms delay
             await session.output_buffer.append(b"delayed output")
 
         # Start output generation
@@ -277,10 +231,12 @@ class TestInteractiveSession:
         result = await session.read_output(timeout_ms=200)
 
         assert "delayed output" in result.output
-        assert 0.04 <= result.execution_time <= 0.20  # Should be around 50ms + some overhead, increased tolerance
+        # Returns after one quiet completion window rather than the full timeout
+        assert result.execution_time < 0.20
 
 
 @pytest.mark.asyncio
+@pytest.mark.slow
 class TestInteractiveSessionAsync:
     """Async test runner for InteractiveSession."""
 
@@ -289,57 +245,44 @@ class TestInteractiveSessionAsync:
         session = InteractiveSession("lifecycle-test")
 
         try:
-            # Mock PTY for testing
-            with patch("openroad_mcp.interactive.session.PTYHandler") as mock_pty_class:
-                mock_pty = AsyncMock()
-                mock_pty.is_process_alive = MagicMock(return_value=True)
-                mock_pty_class.return_value = mock_pty
-                session.pty = mock_pty
-
-                # Test lifecycle: create -> start -> use -> terminate
-                assert session.state == SessionState.CREATING
+            # Test lifecycle: create -> start -> use -> terminate
+            assert session.state == SessionState.CREATING
 
-                await session.start(["echo", "hello"])
-                assert session.state == SessionState.ACTIVE
+            await session.start(["echo", "hello"])
+            assert session.state == SessionState.ACTIVE
 
-                await session.send_command("test")
-                assert session.command_count == 1
+            await session.send_command("test")
+            assert session.command_count == 1
 
-                await session.terminate()
-                assert session.state == SessionState.TERMINATED
+            await session.terminate()
+            assert session.state == SessionState.TERMINATED
 
         finally:
             # Ensure cleanup
             await session.cleanup()
 
-    async def test_concurrent_operations(self):
+    async def test_concurrent_operations(self, mock_pty):
         """Test concurrent session operations."""
-        session = InteractiveSession("concurrent-test")
+        # Mock the methods that background tasks will call
+        mock_pty.read_output.return_value = b""  # Return empty data
+        mock_pty.write_input.return_value = None
 
-        try:
-            with patch("openroad_mcp.interactive.session.PTYHandler") as mock_pty_class:
-                mock_pty = AsyncMock()
-                mock_pty.is_process_alive = MagicMock(return_value=True)
-                # Mock the methods that background tasks will call
-                mock_pty.read_output.return_value = b""  # Return empty data
-                mock_pty.write_input.return_value = None
-
-                # Make wait_for_exit wait indefinitely (until cancelled)
-                async def wait_forever():
-                    await asyncio.Event().wait()  # Wait forever until cancelled
+        # Make wait_for_exit wait indefinitely (until cancelled)
+        async def wait_forever():
+            await asyncio.Event().wait()  # Wait forever until cancelled
 
-                mock_pty.wait_for_exit = wait_forever
+        mock_pty.wait_for_exit = wait_forever
 
-                mock_pty_class.return_value = mock_pty
-                session.pty = mock_pty
+        session = InteractiveSession("concurrent-test")
 
-                await session.start()
+        try:
+            await session.start()
 
-                # Run concurrent operations
-                tasks = [session.send_command(f"command_{i}") for i in range(5)]
+            # Run concurrent operations
+            tasks = [session.send_command(f"command_{i}") for i in range(5)]
 
-                await asyncio.gather(*tasks)
-                assert session.command_count == 5
+            await asyncio.gather(*tasks)
+            assert session.command_count == 5
 
         finally:
             await session.cleanup()
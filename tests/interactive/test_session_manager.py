@@ -11,6 +11,7 @@ from openroad_mcp.interactive.models import SessionNotFoundError, SessionTermina
 
 
 @pytest.mark.asyncio
+@pytest.mark.slow
 class TestSessionManager:
     """Test suite for SessionManager."""
 
@@ -19,13 +20,8 @@ class TestSessionManager:
         """Create a test session manager."""
         return SessionManager()
 
-    async def test_session_manager_initialization(self, session_manager):
-        """Test session manager initialization."""
-        assert session_manager.get_session_count() == 0
-        assert session_manager.get_active_session_count() == 0
-
     async def test_session_manager_basic_functionality(self, session_manager):
-        """Test basic session manager functionality without session creation."""
+        """Test a fresh session manager is empty and rejects unknown sessions."""
         assert session_manager.get_session_count() == 0
         assert session_manager.get_active_session_count() == 0
 
@@ -372,6 +368,7 @@ class TestSessionManager:
 
 
 @pytest.mark.asyncio
+@pytest.mark.slow
 class TestSessionManagerAsync:
     """Async test runner for SessionManager."""
 
@@ -384,26 +381,21 @@ class TestSessionManagerAsync:
 
         manager = SessionManager()
 
-        try:
-            # Create session
-            session_id = await manager.create_session()
-            assert manager.get_session_count() == 1
-
-            # List sessions
-            result = await manager.list_sessions()
-            assert len(result) == 1
+        # Create session
+        session_id = await manager.create_session()
+        assert manager.get_session_count() == 1
 
-            # Get session info
-            info = await manager.get_session_info(session_id)
-            assert info.session_id == session_id
+        # List sessions
+        result = await manager.list_sessions()
+        assert len(result) == 1
 
-            # Cleanup
-            await manager.terminate_session(session_id)
-            assert manager.get_session_count() == 0
+        # Get session info
+        info = await manager.get_session_info(session_id)
+        assert info.session_id == session_id
 
-        finally:
-            # Ensure cleanup via the correct OpenROADManager method
-            await manager.cleanup_all()
+        # Cleanup
+        await manager.terminate_session(session_id)
+        assert manager.get_session_count() == 0
 
     @patch("openroad_mcp.interactive.session.PTYHandler")
     async def test_stress_session_operations(self, mock_pty_class):
@@ -416,30 +408,16 @@ class TestSessionManagerAsync:
         num_sessions = 50
         manager = SessionManager(max_sessions=num_sessions)
 
-        try:
-            # Create many sessions rapidly
-            tasks = []
-            for _ in range(num_sessions):
-                task = manager.create_session()
-                tasks.append(task)
-
-            session_ids = await asyncio.gather(*tasks)
-            assert len(session_ids) == num_sessions
-            assert len(set(session_ids)) == num_sessions  # All unique
-
-            # List all sessions
-            result = await manager.list_sessions()
-            assert len(result) == num_sessions
-
-            # Cleanup some sessions concurrently
-            sessions_to_cleanup = num_sessions // 2
-            cleanup_tasks = []
-            for i in range(sessions_to_cleanup):
-                task = manager.terminate_session(session_ids[i])
-                cleanup_tasks.append(task)
-
-            await asyncio.gather(*cleanup_tasks)
-            assert manager.get_session_count() == num_sessions - sessions_to_cleanup
-
-        finally:
-            await manager.cleanup_all()
+        # Create many sessions rapidly
+        session_ids = await asyncio.gather(*(manager.create_session() for _ in range(num_sessions)))
+        assert len(session_ids) == num_sessions
+        assert len(set(session_ids)) == num_sessions  # All unique
+
+        # List all sessions
+        result = await manager.list_sessions()
+        assert len(result) == num_sessions
+
+        # Cleanup some sessions concurrently
+        sessions_to_cleanup = num_sessions // 2
+        await asyncio.gather(*(manager.terminate_session(sid) for sid in session_ids[:sessions_to_cleanup]))
+        assert manager.get_session_count() == num_sessions - sessions_to_cleanup
@@ -1,17 +1,60 @@
 """Tests for Report Images MCP Tools implementation."""
 
 import base64
+import io
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from PIL import Image
 
 from openroad_mcp.config.settings import Settings
+from openroad_mcp.tools import report_images
 from openroad_mcp.tools.report_images import (
     ListReportImagesTool,
+    ReadReportImagesBulkTool,
     ReadReportImageTool,
+    _iso_mtime,
+    _platform_design_error,
+    _webp_dims,
     classify_image_type,
+    load_and_compress_image,
+    validate_platform_design,
 )
+from openroad_mcp.utils.cleanup import cleanup_manager
+
+
+@pytest.fixture(autouse=True)
+def clear_validation_cache():
+    """Keep cached platform/design validation from leaking between tests."""
+    _platform_design_error.cache_clear()
+    yield
+    _platform_design_error.cache_clear()
+
+
+def _deny_scandir(blocked):
+    """Patch os.scandir so listing the blocked directory raises PermissionError.
+
+    Running as root ignores permission bits, so chmod cannot be used to simulate this.
+    """
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if os.fspath(path) == os.fspath(blocked):
+            raise PermissionError(13, "Permission denied", os.fspath(path))
+        return real_scandir(path)
+
+    return patch("openroad_mcp.tools.report_images.os.scandir", side_effect=scandir)
+
+
+def _encode_webp(mode: str = "RGB", size: tuple[int, int] = (301, 157), **kwargs) -> bytes:
+    """Encode a blank image as WEBP bytes."""
+    buffer = io.BytesIO()
+    Image.new(mode, size).save(buffer, format="WEBP", **kwargs)
+    return buffer.getvalue()
 
 
 class TestClassifyImageType:
@@ -40,6 +83,88 @@ class TestClassifyImageType:
         assert classify_image_type("no_underscore.webp") == ("no", "unknown")
 
 
+class TestIsoMtime:
+    """Test suite for the mtime formatter."""
+
+    def test_matches_datetime_isoformat(self):
+        """Test output matches datetime.isoformat at second resolution."""
+        timestamp = 1760000000.75
+        expected = datetime.fromtimestamp(int(timestamp)).isoformat()
+        assert _iso_mtime(timestamp) == expected
+
+
+class TestWebpDims:
+    """Test suite for the WEBP header dimension parser."""
+
+    @pytest.mark.parametrize(
+        "mode,kwargs",
+        [
+            ("RGB", {}),
+            ("RGB", {"lossless": True}),
+            ("RGBA", {}),
+        ],
+        ids=["vp8", "vp8l", "vp8x"],
+    )
+    def test_parses_container_variants(self, mode, kwargs):
+        """Test dimensions are read from each WEBP chunk layout."""
+        assert _webp_dims(_encode_webp(mode, **kwargs)) == (301, 157)
+
+    def test_rejects_non_webp(self):
+        """Test non-WEBP data yields None."""
+        assert _webp_dims(b"fake webp image data") is None
+        assert _webp_dims(b"RIFF") is None
+
+    def test_small_image_skips_pil(self, tmp_path):
+        """Test the under-threshold path does not open the image with PIL."""
+        image_file = tmp_path / "final_all.webp"
+        image_file.write_bytes(_encode_webp())
+
+        with patch("openroad_mcp.tools.report_images.Image") as mock_image:
+            result = load_and_compress_image(image_file)
+
+        mock_image.open.assert_not_called()
+        assert result[1] is False
+        assert result[4:] == (301, 157, 301, 157)
+
+
+class TestLoadAndCompressImage:
+    """Test suite for resampling filter selection when compressing."""
+
+    @pytest.fixture
+    def mock_image(self):
+        """Patch PIL so resize calls can be inspected."""
+        with patch("openroad_mcp.tools.report_images.Image") as mock_image:
+            mock_img = mock_image.open.return_value.__enter__.return_value
+            mock_img.size = (4000, 4000)
+            mock_img.resize.return_value.save.side_effect = lambda buffer, **kwargs: buffer.write(b"webp")
+            yield mock_image
+
+    @pytest.mark.parametrize(
+        "file_size,expected",
+        [(16 * 1024, "LANCZOS"), (4 * 1024 * 1024, "BICUBIC")],
+        ids=["near-original", "heavy-downscale"],
+    )
+    def test_filter_follows_scale(self, mock_image, tmp_path, file_size, expected):
+        """Test LANCZOS is used for mild downscaling and BICUBIC for heavy downscaling."""
+        image_file = tmp_path / "final_all.webp"
+        image_file.write_bytes(b"x" * file_size)
+
+        load_and_compress_image(image_file)
+
+        _, resample = mock_image.open.return_value.__enter__.return_value.resize.call_args.args
+        assert resample is getattr(mock_image.Resampling, expected)
+
+    def test_explicit_filter_is_respected(self, mock_image, tmp_path):
+        """Test callers can force a resampling filter."""
+        image_file = tmp_path / "final_all.webp"
+        image_file.write_bytes(b"x" * (4 * 1024 * 1024))
+
+        load_and_compress_image(image_file, resample=Image.Resampling.LANCZOS)
+
+        _, resample = mock_image.open.return_value.__enter__.return_value.resize.call_args.args
+        assert resample is Image.Resampling.LANCZOS
+
+
 @pytest.mark.asyncio
 class TestListReportImagesTool:
     """Test suite for ListReportImagesTool."""
@@ -88,6 +213,21 @@ class TestListReportImagesTool:
         assert result["error"] == "RunSlugNotFound"
         assert "Run slug 'nonexistent-run' not found" in result["message"]
 
+    async def test_list_images_run_slug_not_found_lists_first_five_sorted(self, tool, mock_settings, tmp_path):
+        """Test the suggested run slugs are the first five in sorted order."""
+        reports_dir = tmp_path / "reports" / "nangate45" / "gcd"
+        for name in ["run-g", "run-c", "run-a", "run-f", "run-b", "run-e", "run-d"]:
+            (reports_dir / name).mkdir(parents=True)
+
+        mock_settings.platforms = ["nangate45"]
+        mock_settings.designs = lambda p: ["gcd"] if p == "nangate45" else []
+
+        result_json = await tool.execute("nangate45", "gcd", "nonexistent-run")
+        result = json.loads(result_json)
+
+        assert result["error"] == "RunSlugNotFound"
+        assert result["message"].endswith("Available run slugs: run-a, run-b, run-c, run-d, run-e")
+
     async def test_list_images_no_webp_files(self, tool, mock_settings, tmp_path):
         """Test listing when no webp images exist."""
         run_path = tmp_path / "reports" / "nangate45" / "gcd" / "run-123"
@@ -132,6 +272,44 @@ class TestListReportImagesTool:
         assert cts_image["type"] == "clock_visualization"
         assert cts_image["size_bytes"] == 14
 
+    async def test_list_images_nested_directories(self, tool, mock_settings, tmp_path):
+        """Test images in subdirectories of the run are listed with their full path."""
+        run_path = tmp_path / "reports" / "nangate45" / "gcd" / "run-123"
+        nested = run_path / "base"
+        nested.mkdir(parents=True)
+
+        (nested / "final_all.webp").write_bytes(b"fake final image")
+        (run_path / "notes.txt").write_text("not an image")
+
+        mock_settings.platforms = ["nangate45"]
+        mock_settings.designs = lambda p: ["gcd"] if p == "nangate45" else []
+
+        result_json = await tool.execute("nangate45", "gcd", "run-123")
+        result = json.loads(result_json)
+
+        assert result["run_path"] == str(run_path)
+        assert result["total_images"] == 1
+        assert result["images_by_stage"]["final"][0]["path"] == str(nested / "final_all.webp")
+
+    async def test_list_images_skips_unreadable_directories(self, tool, mock_settings, tmp_path):
+        """Test an unreadable subdirectory is skipped instead of failing the listing."""
+        run_path = tmp_path / "reports" / "nangate45" / "gcd" / "run-123"
+        locked = run_path / "locked"
+        locked.mkdir(parents=True)
+
+        (run_path / "final_all.webp").write_bytes(b"fake final image")
+        (locked / "cts_clk.webp").write_bytes(b"fake cts image")
+
+        mock_settings.platforms = ["nangate45"]
+        mock_settings.designs = lambda p: ["gcd"] if p == "nangate45" else []
+
+        with _deny_scandir(locked):
+            result = json.loads(await tool.execute("nangate45", "gcd", "run-123"))
+
+        assert result["error"] is None
+        assert result["total_images"] == 1
+        assert result["images_by_stage"]["final"][0]["filename"] == "final_all.webp"
+
     async def test_list_images_filter_by_stage(self, tool, mock_settings, tmp_path):
         """Test filtering images by stage."""
         run_path = tmp_path / "reports" / "nangate45" / "gcd" / "run-123"
@@ -151,6 +329,24 @@ class TestListReportImagesTool:
         assert "cts" in result["images_by_stage"]
         assert "final" not in result["images_by_stage"]
 
+    async def test_list_images_filter_unknown_stage(self, tool, mock_settings, tmp_path):
+        """Test filtering on the 'unknown' stage still matches names without an underscore."""
+        run_path = tmp_path / "reports" / "nangate45" / "gcd" / "run-123"
+        run_path.mkdir(parents=True)
+
+        (run_path / "overview.webp").write_bytes(b"fake image")
+        (run_path / "final_all.webp").write_bytes(b"fake final image")
+        (run_path / "dir.webp").mkdir()
+
+        mock_settings.platforms = ["nangate45"]
+        mock_settings.designs = lambda p: ["gcd"] if p == "nangate45" else []
+
+        result_json = await tool.execute("nangate45", "gcd", "run-123", "unknown")
+        result = json.loads(result_json)
+
+        assert result["total_images"] == 1
+        assert result["images_by_stage"]["unknown"][0]["filename"] == "overview.webp"
+
 
 @pytest.mark.asyncio
 class TestReadReportImageTool:
@@ -218,6 +414,41 @@ class TestReadReportImageTool:
         assert "Image 'missing.webp' not found" in result["message"]
         assert "existing.webp" in result["message"]
 
+    async def test_read_image_not_found_skips_unreadable_directories(self, tool, mock_settings, tmp_path):
+        """Test the alternatives listing skips unreadable subdirectories."""
+        run_path = tmp_path / "reports" / "nangate45" / "gcd" / "run-123"
+        locked = run_path / "locked"
+        locked.mkdir(parents=True)
+
+        (run_path / "existing.webp").write_bytes(b"fake image")
+
+        mock_settings.platforms = ["nangate45"]
+        mock_settings.designs = lambda p: ["gcd"] if p == "nangate45" else []
+
+        with _deny_scandir(locked):
+            result = json.loads(await tool.execute("nangate45", "gcd", "run-123", "missing.webp"))
+
+        assert result["error"] == "ImageNotFound"
+        assert "existing.webp" in result["message"]
+
+    async def test_read_image_not_found_caps_alternatives(self, tool, mock_settings, tmp_path):
+        """Test the list of alternatives in the error is bounded."""
+        run_path = tmp_path / "reports" / "nangate45" / "gcd" / "run-123"
+        run_path.mkdir(parents=True)
+
+        for i in range(25):
+            (run_path / f"shot_{i:02d}.webp").write_bytes(b"fake image")
+
+        mock_settings.platforms = ["nangate45"]
+        mock_settings.designs = lambda p: ["gcd"] if p == "nangate45" else []
+
+        result_json = await tool.execute("nangate45", "gcd", "run-123", "missing.webp")
+        result = json.loads(result_json)
+
+        assert result["error"] == "ImageNotFound"
+        assert "(showing first 20)" in result["message"]
+        assert result["message"].count("shot_") == 20
+
     async def test_read_image_success(self, tool, mock_settings, tmp_path):
         """Test successful image reading."""
         run_path = tmp_path / "reports" / "nangate45" / "gcd" / "run-123"
@@ -297,6 +528,143 @@ class TestReadReportImageTool:
         assert "exceeds maximum allowed size" in result["message"]
 
 
+@pytest.mark.asyncio
+class TestReadReportImagesBulkTool:
+    """Test suite for ReadReportImagesBulkTool."""
+
+    @pytest.fixture
+    def tool(self):
+        """Create ReadReportImagesBulkTool with mock manager."""
+        return ReadReportImagesBulkTool(AsyncMock())
+
+    @pytest.fixture(autouse=True)
+    def shutdown_pool(self):
+        """Stop the shared compression pool so worker processes do not outlive the test."""
+        yield
+        report_images._shutdown_compression_pool()
+
+    @pytest.fixture
+    def run_path(self, tmp_path):
+        """Create a run directory and mock settings pointing at it."""
+        run_path = tmp_path / "reports" / "nangate45" / "gcd" / "run-123"
+        run_path.mkdir(parents=True)
+        with patch("openroad_mcp.tools.report_images.settings") as mock:
+            mock.flow_path = tmp_path
+            mock.platforms = ["nangate45"]
+            mock.designs = lambda p: ["gcd"] if p == "nangate45" else []
+            yield run_path
+
+    async def test_read_multiple_images(self, tool, run_path):
+        """Test every requested image is returned in request order."""
+        (run_path / "cts_clk.webp").write_bytes(_encode_webp(size=(64, 32)))
+        (run_path / "final_all.webp").write_bytes(_encode_webp(size=(48, 48)))
+
+        result = json.loads(await tool.execute("nangate45", "gcd", "run-123", ["final_all.webp", "cts_clk.webp"]))
+
+        assert result["error"] is None
+        assert [image["metadata"]["filename"] for image in result["images"]] == ["final_all.webp", "cts_clk.webp"]
+        assert result["images"][0]["metadata"]["width"] == 48
+        assert result["images"][1]["metadata"]["stage"] == "cts"
+        assert base64.b64decode(result["images"][1]["image_data"]) == (run_path / "cts_clk.webp").read_bytes()
+
+    async def test_per_image_errors_do_not_fail_batch(self, tool, run_path):
+        """Test invalid or missing images are reported alongside successful reads."""
+        (run_path / "final_all.webp").write_bytes(_encode_webp())
+
+        result = json.loads(
+            await tool.execute("nangate45", "gcd", "run-123", ["missing.webp", "final_all.webp", "../x.webp"])
+        )
+
+        assert result["error"] is None
+        errors = [image["error"] for image in result["images"]]
+        assert errors == ["ImageNotFound", None, "ValidationError"]
+
+    async def test_compresses_large_images_in_process_pool(self, tool, run_path):
+        """Test batches above the process pool threshold are compressed in worker processes."""
+        noisy = Image.frombytes("RGB", (256, 256), os.urandom(256 * 256 * 3))
+        names = [f"final_{i}.webp" for i in range(4)]
+        for name in names:
+            noisy.save(run_path / name, format="WEBP", lossless=True)
+
+        with patch("openroad_mcp.tools.report_images.BULK_PROCESS_POOL_MIN_IMAGES", 2):
+            result = json.loads(await tool.execute("nangate45", "gcd", "run-123", names))
+            pool = report_images._compression_pool
+            await tool.execute("nangate45", "gcd", "run-123", names)
+
+        assert result["error"] is None
+        assert len(result["images"]) == 4
+        for image in result["images"]:
+            assert image["error"] is None
+            assert image["metadata"]["compression_applied"] is True
+
+        # The pool is started once and reused across calls
+        assert pool is not None
+        assert report_images._compression_pool is pool
+
+    async def test_pool_restarts_do_not_register_more_cleanup_handlers(self):
+        """Test the pool's cleanup handler is registered once no matter how often the pool restarts."""
+        for _ in range(3):
+            report_images._get_compression_pool()
+            report_images._shutdown_compression_pool()
+
+        handlers = cleanup_manager._cleanup_handlers
+        assert handlers.count(report_images._shutdown_compression_pool) == 1
+
+    async def test_under_threshold_images_never_reach_pool(self, tool, run_path):
+        """Test only images that need compression are sent to the process pool."""
+        noisy = Image.frombytes("RGB", (256, 256), os.urandom(256 * 256 * 3))
+        large = [f"final_{i}.webp" for i in range(2)]
+        for name in large:
+            noisy.save(run_path / name, format="WEBP", lossless=True)
+        small = ["cts_clk.webp", "final_all.webp"]
+        for name in small:
+            (run_path / name).write_bytes(_encode_webp(size=(32, 32)))
+
+        submitted = []
+
+        class RecordingPool(ThreadPoolExecutor):
+            def submit(self, fn, /, *args, **kwargs):
+                submitted.append(args[0].name)
+                return super().submit(fn, *args, **kwargs)
+
+        with (
+            RecordingPool(max_workers=2) as pool,
+            patch("openroad_mcp.tools.report_images._get_compression_pool", return_value=pool),
+            patch("openroad_mcp.tools.report_images.BULK_PROCESS_POOL_MIN_IMAGES", 2),
+        ):
+            result = json.loads(await tool.execute("nangate45", "gcd", "run-123", small + large))
+
+        assert sorted(submitted) == large
+        assert [image["metadata"]["compression_applied"] for image in result["images"]] == [False, False, True, True]
+
+    async def test_small_batch_does_not_start_pool(self, tool, run_path):
+        """Test a batch with nothing to compress never starts the process pool."""
+        names = [f"final_{i}.webp" for i in range(4)]
+        for name in names:
+            (run_path / name).write_bytes(_encode_webp(size=(32, 32)))
+
+        with (
+            patch("openroad_mcp.tools.report_images._get_compression_pool") as get_pool,
+            patch("openroad_mcp.tools.report_images.BULK_PROCESS_POOL_MIN_IMAGES", 1),
+        ):
+            result = json.loads(await tool.execute("nangate45", "gcd", "run-123", names))
+
+        get_pool.assert_not_called()
+        assert all(image["error"] is None for image in result["images"])
+
+    async def test_empty_request_rejected(self, tool, run_path):
+        """Test an empty image list is rejected."""
+        result = json.loads(await tool.execute("nangate45", "gcd", "run-123", []))
+
+        assert result["error"] == "ValidationError"
+
+    async def test_run_slug_not_found(self, tool, run_path):
+        """Test error when run slug doesn't exist."""
+        result = json.loads(await tool.execute("nangate45", "gcd", "nonexistent-run", ["final_all.webp"]))
+
+        assert result["error"] == "RunSlugNotFound"
+
+
 class TestSettingsPlatformDesignDiscovery:
     """Test suite for Settings.platforms and Settings.designs methods."""
 
@@ -543,3 +911,24 @@ class TestPlatformDesignValidationInTools:
         assert result["error"] == "ValidationError"
         assert "invalid_design" in result["message"]
         assert "gcd" in result["message"]
+
+    def test_validation_is_cached(self, mock_settings):
+        """Test repeated validation of the same platform/design does not rescan the flow directory."""
+        mock_settings.platforms = ["nangate45"]
+        mock_settings.designs = MagicMock(return_value=["gcd"])
+
+        validate_platform_design("nangate45", "gcd")
+        validate_platform_design("nangate45", "gcd")
+
+        mock_settings.designs.assert_called_once_with("nangate45")
+
+    def test_validation_cache_expires(self, mock_settings):
+        """Test cached results are refreshed once the TTL window passes."""
+        mock_settings.platforms = ["nangate45"]
+        mock_settings.designs = MagicMock(return_value=["gcd"])
+
+        with patch("openroad_mcp.tools.report_images.time.monotonic", side_effect=[0.0, 1000.0]):
+            validate_platform_design("nangate45", "gcd")
+            validate_platform_design("nangate45", "gcd")
+
+        assert mock_settings.designs.call_count == 2
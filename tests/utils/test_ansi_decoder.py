@@ -0,0 +1,175 @@
+"""Tests for ANSI escape sequence decoding utilities."""
+
+import pytest
+
+from openroad_mcp.utils.ansi_decoder import ANSIDecoder, _decode_escape_sequence, _sequence_label
+
+SAMPLE = "openroad> \x1b[1mreport_checks\x1b[0m\r\nslack \x1b[31m-0.12\x1b[0m\x1b[K\r\n"
+
+
+class TestDecodeEscapeSequence:
+    """Test suite for ANSIDecoder.decode_escape_sequence."""
+
+    @pytest.mark.parametrize(
+        "sequence,expected",
+        [
+            ("\x1b[0m", "Reset all formatting"),
+            ("\x1b[?2004h", "Enable bracketed paste mode"),
+            ("\x1b[?25l", "Hide cursor"),
+            ("\x1b[2K", "Clear entire line"),
+            ("\x1b[H", "Move cursor to home"),
+        ],
+    )
+    def test_literal_sequences(self, sequence, expected):
+        """Test literal table entries decode via exact lookup."""
+        assert ANSIDecoder.decode_escape_sequence(sequence) == expected
+
+    @pytest.mark.parametrize(
+        "sequence,expected",
+        [
+            ("\x1b[12A", "Move cursor up"),
+            ("\x1b[4h", "Enable terminal mode"),
+            ("\x1b[10;20H", "Move cursor to position"),
+        ],
+    )
+    def test_parametric_sequences(self, sequence, expected):
+        """Test parametric table entries still match by pattern."""
+        assert ANSIDecoder.decode_escape_sequence(sequence) == expected
+
+    def test_fallback_descriptions(self):
+        """Test sequences outside the table fall back to generic descriptions."""
+        assert ANSIDecoder.decode_escape_sequence("\x1b[38;5;1m") == "Text formatting (\x1b[38;5;1m)"
+        assert ANSIDecoder.decode_escape_sequence("\x1b[?7h") == "Enable terminal mode (\x1b[?7h)"
+        assert ANSIDecoder.decode_escape_sequence("\x1b[5Z") == "Unknown escape sequence (\x1b[5Z)"
+
+    def test_repeated_sequences_are_cached(self):
+        """Test each distinct sequence is decoded once across calls."""
+        _decode_escape_sequence.cache_clear()
+        _sequence_label.cache_clear()
+
+        ANSIDecoder.get_sequence_stats("\x1b[1m" * 50 + "\x1b[0m" * 50)
+        ANSIDecoder.translate_output("\x1b[1mbold\x1b[0m", mode="annotate")
+
+        info = _decode_escape_sequence.cache_info()
+        assert info.misses == 2
+        assert info.hits == 2
+
+
+class TestTranslateOutput:
+    """Test suite for ANSIDecoder.translate_output."""
+
+    def test_remove_mode(self):
+        """Test escape sequences are removed and carriage returns normalized."""
+        assert ANSIDecoder.translate_output(SAMPLE, mode="remove") == "openroad> report_checks\nslack -0.12\n"
+
+    def test_annotate_mode(self):
+        """Test escape sequences are replaced with descriptions."""
+        result = ANSIDecoder.translate_output(SAMPLE, mode="annotate")
+
+        assert result == (
+            "openroad> [Bold text]report_checks[Reset all formatting]\n"
+            "slack [Red text]-0.12[Reset all formatting][Clear line from cursor to end]\n"
+        )
+
+    def test_preserve_mode(self):
+        """Test escape sequences are kept and followed by descriptions."""
+        result = ANSIDecoder.translate_output("\x1b[32mok\x1b[0m\r", mode="preserve")
+
+        assert result == "\x1b[32m[Green text]ok\x1b[0m[Reset all formatting]\r"
+
+    def test_decode_mode_lists_each_sequence_once(self):
+        """Test decode mode appends one breakdown line per distinct sequence."""
+        result = ANSIDecoder.translate_output("\x1b[1ma\x1b[0mb\x1b[1m", mode="decode")
+
+        lines = result.split("\n")
+        assert lines[-3] == "--- ANSI Escape Sequence Breakdown ---"
+        assert lines[-2:] == ["'\\x1b[1m' -> Bold text", "'\\x1b[0m' -> Reset all formatting"]
+
+    def test_many_distinct_sequences(self):
+        """Test every distinct cursor sequence is annotated in place."""
+        text = "".join(f"\x1b[{row};1Hrow{row}" for row in range(1, 200))
+
+        result = ANSIDecoder.translate_output(text, mode="annotate")
+
+        assert "\x1b" not in result
+        assert result.count("[Move cursor to position]") == 199
+
+    def test_empty_text(self):
+        """Test empty input is returned unchanged."""
+        assert ANSIDecoder.translate_output("", mode="annotate") == ""
+
+    @pytest.mark.parametrize(
+        ("mode", "expected"),
+        [
+            ("remove", "a\nb\nc"),
+            ("annotate", "a\nbc"),
+            ("preserve", "a\r\nb\rc"),
+            ("decode", "a\r\nb\rc\n\n--- ANSI Escape Sequence Breakdown ---"),
+        ],
+    )
+    def test_plain_text_without_escapes(self, mode, expected):
+        """Test text without escapes still gets each mode's carriage-return handling."""
+        assert ANSIDecoder.translate_output("a\r\nb\rc", mode=mode) == expected
+
+    def test_unknown_mode(self):
+        """Test an unknown mode is rejected."""
+        with pytest.raises(ValueError, match="Unknown mode"):
+            ANSIDecoder.translate_output("text", mode="bogus")
+
+
+class TestGetSequenceStats:
+    """Test suite for ANSIDecoder.get_sequence_stats."""
+
+    def test_counts_sequences(self):
+        """Test occurrences are counted per sequence."""
+        stats = ANSIDecoder.get_sequence_stats(SAMPLE)
+
+        assert stats == {
+            "'\\x1b[1m' (Bold text)": 1,
+            "'\\x1b[0m' (Reset all formatting)": 2,
+            "'\\x1b[31m' (Red text)": 1,
+            "'\\x1b[K' (Clear line from cursor to end)": 1,
+        }
+
+    def test_counts_repeated_sequences(self):
+        """Test a sequence repeated many times is reported once with its total."""
+        stats = ANSIDecoder.get_sequence_stats("x\x1b[0m" * 1000)
+
+        assert stats == {"'\\x1b[0m' (Reset all formatting)": 1000}
+
+    def test_labels_are_cached_across_calls(self):
+        """Test each distinct sequence's stats key is formatted only once."""
+        _sequence_label.cache_clear()
+
+        for _ in range(3):
+            ANSIDecoder.get_sequence_stats("\x1b[1mbold\x1b[0m")
+
+        info = _sequence_label.cache_info()
+        assert info.misses == 2
+        assert info.hits == 4
+
+    def test_no_sequences(self):
+        """Test plain text yields no stats."""
+        assert ANSIDecoder.get_sequence_stats("plain text") == {}
+
+
+class TestCleanOpenroadOutput:
+    """Test suite for ANSIDecoder.clean_openroad_output."""
+
+    def test_strips_prompt_and_blank_lines(self):
+        """Test prompts, escapes and blank lines are removed."""
+        raw = "openroad> \x1b[1mreport_wns\x1b[0m\r\n\r\n  \r\nwns 0.00\r\nopenroad> "
+
+        assert ANSIDecoder.clean_openroad_output(raw) == "report_wns\nwns 0.00"
+
+    def test_preserves_indentation_after_blank_lines(self):
+        """Test indentation of the line following a blank line is kept."""
+        assert ANSIDecoder.clean_openroad_output("a\n\n    b") == "a\n    b"
+
+    def test_plain_output_without_escapes(self):
+        """Test prompt and blank-line cleanup still apply when there are no escapes."""
+        assert ANSIDecoder.clean_openroad_output("openroad> a\r\n\r\nb\r\n") == "a\nb"
+
+    def test_prompt_between_blank_lines(self):
+        """Test prompt removal and blank-line collapsing compose as separate passes would."""
+        assert ANSIDecoder.clean_openroad_output("a\n\nopenroad> b\n openroad>\n\nc") == "a\nb\n c"
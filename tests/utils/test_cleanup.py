@@ -0,0 +1,112 @@
+"""Tests for cleanup utilities."""
+
+import asyncio
+import logging
+
+from openroad_mcp.utils.cleanup import CleanupManager
+
+
+class TestSyncCleanup:
+    """Test suite for CleanupManager.sync_cleanup."""
+
+    def test_runs_sync_and_async_handlers(self):
+        """Test both handler kinds run once at exit."""
+        manager = CleanupManager()
+        calls: list[str] = []
+
+        async def async_handler() -> None:
+            await asyncio.sleep(0)
+            calls.append("async")
+
+        manager.register_cleanup_handler(lambda: calls.append("sync"))
+        manager.register_async_cleanup_handler(async_handler)
+
+        manager.sync_cleanup()
+        manager.sync_cleanup()
+
+        assert calls == ["sync", "async"]
+
+    def test_plain_async_handlers_skip_event_loop(self, monkeypatch):
+        """Test handlers that return no coroutine never start an event loop."""
+        manager = CleanupManager()
+        calls: list[str] = []
+
+        def fail_run(*_args, **_kwargs):
+            raise AssertionError("event loop should not be started")
+
+        monkeypatch.setattr(asyncio, "run", fail_run)
+        manager.register_async_cleanup_handler(lambda: calls.append("plain"))
+
+        manager.sync_cleanup()
+
+        assert calls == ["plain"]
+
+    def test_handler_errors_do_not_stop_cleanup(self, caplog):
+        """Test a failing handler does not prevent the rest from running."""
+        manager = CleanupManager()
+        calls: list[str] = []
+
+        def broken() -> None:
+            raise RuntimeError("boom")
+
+        async def failing() -> None:
+            raise RuntimeError("boom")
+
+        async def working() -> None:
+            calls.append("async")
+
+        manager.register_cleanup_handler(broken)
+        manager.register_cleanup_handler(lambda: calls.append("sync"))
+        manager.register_async_cleanup_handler(broken)
+        manager.register_async_cleanup_handler(failing)
+        manager.register_async_cleanup_handler(working)
+
+        with caplog.at_level(logging.ERROR, logger="openroad_mcp.utils.cleanup"):
+            manager.sync_cleanup()
+
+        assert calls == ["sync", "async"]
+        errors = [record for record in caplog.records if record.levelno == logging.ERROR]
+        assert len(errors) == 1
+        assert "3 cleanup handler(s) failed" in errors[0].getMessage()
+
+
+class TestAsyncCleanup:
+    """Test suite for CleanupManager.async_cleanup."""
+
+    async def test_runs_handlers_in_running_loop(self):
+        """Test async cleanup awaits handlers on the current loop."""
+        manager = CleanupManager()
+        calls: list[str] = []
+
+        async def async_handler() -> None:
+            calls.append("async")
+
+        manager.register_cleanup_handler(lambda: calls.append("sync"))
+        manager.register_async_cleanup_handler(async_handler)
+
+        await manager.async_cleanup()
+        await manager.async_cleanup()
+
+        assert calls == ["sync", "async"]
+
+    async def test_async_handlers_run_concurrently(self):
+        """Test async handlers overlap instead of running one after another."""
+        manager = CleanupManager()
+        started = 0
+        finished = 0
+        all_started = asyncio.Event()
+
+        async def handler() -> None:
+            nonlocal started, finished
+            started += 1
+            if started == 3:
+                all_started.set()
+            await asyncio.wait_for(all_started.wait(), timeout=0.5)
+            finished += 1
+
+        for _ in range(3):
+            manager.register_async_cleanup_handler(handler)
+
+        await manager.async_cleanup()
+
+        assert finished == 3
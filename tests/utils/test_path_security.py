@@ -1,9 +1,13 @@
 """Tests for path security validation utilities."""
 
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
 
 from openroad_mcp.core.exceptions import ValidationError
 from openroad_mcp.utils.path_security import (
+    _resolved_base,
     validate_path_segment,
     validate_safe_path_containment,
 )
@@ -127,6 +131,52 @@ class TestValidateSafePathContainment:
         with pytest.raises(ValidationError, match="test path .* is not contained within"):
             validate_safe_path_containment(target, base, "test")
 
+    def test_base_path_itself_passes(self, tmp_path):
+        """Test the base directory counts as contained within itself."""
+        base = tmp_path / "base"
+        base.mkdir()
+
+        validate_safe_path_containment(base, base, "test")
+
+    def test_sibling_with_shared_prefix_rejected(self, tmp_path):
+        """Test a sibling whose name starts with the base name is rejected."""
+        base = tmp_path / "base"
+        base.mkdir()
+        sibling = tmp_path / "base_evil"
+        sibling.mkdir()
+
+        with pytest.raises(ValidationError, match="test path .* is not contained within"):
+            validate_safe_path_containment(sibling, base, "test")
+
+    def test_base_resolution_is_cached(self, tmp_path):
+        """Test validating many targets against one base resolves the base once."""
+        base = tmp_path / "base"
+        base.mkdir()
+        _resolved_base.cache_clear()
+
+        with patch("openroad_mcp.utils.path_security.time.monotonic", return_value=0.0):
+            for i in range(5):
+                validate_safe_path_containment(base / f"file{i}", base, "test")
+
+        info = _resolved_base.cache_info()
+        assert info.misses == 1
+        assert info.hits == 4
+
+    def test_relative_base_follows_working_directory(self, tmp_path, monkeypatch):
+        """Test a cached relative base is not reused after the working directory changes."""
+        for name in ("first", "second"):
+            (tmp_path / name / "base").mkdir(parents=True)
+        _resolved_base.cache_clear()
+
+        with patch("openroad_mcp.utils.path_security.time.monotonic", return_value=0.0):
+            monkeypatch.chdir(tmp_path / "first")
+            validate_safe_path_containment(tmp_path / "first" / "base" / "file", Path("base"), "test")
+
+            monkeypatch.chdir(tmp_path / "second")
+            validate_safe_path_containment(tmp_path / "second" / "base" / "file", Path("base"), "test")
+            with pytest.raises(ValidationError, match="is not contained within"):
+                validate_safe_path_containment(tmp_path / "first" / "base" / "file", Path("base"), "test")
+
 
 class TestPathTraversalAttackVectors:
     """Test suite for common path traversal attack vectors."""